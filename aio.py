@@ -16,46 +16,83 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
 
-class SyncToAsync:
-    from functools import partial
+import asyncio
+import os
+import threading
+from types import MethodType
+
+_loop = None
+_loopLock = threading.Lock()
+
+def getLoop() -> asyncio.AbstractEventLoop:
+    """
+    Возвращает фоновый цикл событий, в котором выполняются синхронные вызовы. Цикл запускается в отдельном потоке при первом обращении и живёт до завершения процесса, поэтому сессии `httpx` и их пулы соединений переиспользуются между вызовами. В дочернем процессе после `os.fork()` создаётся новый цикл, так как поток родительского цикла не копируется.
+    """
+
+    global _loop
+
+    if _loop is None:
+        with _loopLock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="geniux-loop", daemon=True)
+                thread.start()
+                _loop = loop
+
+    return _loop
+
+
+def resetLoop() -> None:
+    global _loop, _loopLock
+
+    _loop = None
+    _loopLock = threading.Lock()
+
 
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=resetLoop)
+
+
+def runSync(coroutine: any) -> any:
+    """
+    Выполняет корутину в фоновом цикле событий и блокирует текущий поток до её завершения. Контекстные переменные вызывающего потока передаются в задачу: `run_coroutine_threadsafe` планирует её создание с копией текущего контекста.
+    """
+
+    future = asyncio.run_coroutine_threadsafe(coroutine, getLoop())
+
+    try:
+        return future.result()
+
+    except BaseException:
+        future.cancel()
+        raise
+
+
+class SyncToAsync:
     def __init__(self, func: callable) -> None:
         self.func = func
 
 
-    def __get__(self, instance: any, owner: any) -> partial:
-        from functools import partial
+    def __get__(self, instance: any, owner: any) -> any:
+        if instance is None:
+            return self
 
-        return partial(self.__call__, instance)
+        return MethodType(self, instance)
 
 
     def __call__(self, instance: any, *args: any, **kwargs: any) -> any:
-        from asyncio import get_event_loop, new_event_loop, set_event_loop
+        coroutine = self.func(instance, *args, **kwargs)
 
         try:
-            loop = get_event_loop()
-            if loop.is_running():
-                return self.func(instance, *args, **kwargs)
-
-            else:
-                return loop.run_until_complete(self.func(instance, *args, **kwargs))
+            asyncio.get_running_loop()
 
         except RuntimeError:
-            newLoop = new_event_loop()
-            set_event_loop(newLoop)
-            result = newLoop.run_until_complete(self.func(instance, *args, **kwargs))
-            newLoop.close()
-            return result
+            return runSync(coroutine)
 
-        finally:
-            set_event_loop(loop)
+        return coroutine
 
 
 def asyncFunction(func: any) -> any:
-    from functools import wraps
-
-    @wraps(func)
-    async def wrapper(instance: any, *args: any, **kwargs: any) -> any:
-        return await func(instance, *args, **kwargs)
+    from functools import update_wrapper
 
-    return SyncToAsync(wrapper)
\ No newline at end of file
+    return update_wrapper(SyncToAsync(func), func)
\ No newline at end of file
@@ -0,0 +1,45 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Сравнивает скорость извлечения текста песни разными парсерами BeautifulSoup на страницах из `tests/fixtures`.
+
+Запуск: python benchmarks/lyricsBackends.py [число повторов]
+"""
+
+import sys
+from importlib.util import find_spec
+from pathlib import Path
+from timeit import repeat
+
+from geniux.lyricsParser import parseLyrics
+
+fixtures = sorted((Path(__file__).parent.parent / "tests" / "fixtures").glob("*.html"))
+backends = [backend for backend in ("html.parser", "lxml", "html5lib") if backend == "html.parser" or find_spec(backend)]
+
+def main(number: int = 50) -> None:
+    print(f"{'page':<12}{'size':>10}" + "".join(f"{backend:>14}" for backend in backends))
+
+    for fixture in fixtures:
+        page = fixture.read_text()
+        timings = [min(repeat(lambda: parseLyrics(page, parser=backend), number=number, repeat=3)) / number for backend in backends]
+        print(f"{fixture.stem:<12}{len(page):>10}" + "".join(f"{timing * 1000:>11.2f} ms" for timing in timings))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
\ No newline at end of file
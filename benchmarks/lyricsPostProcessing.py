@@ -0,0 +1,50 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Измеряет время постобработки текста песни: перевод HTML в Markdown и MarkdownV2 и удаление заголовков секций при `removeSections=True`. Длинный текст получается повторением текста со страницы `tests/fixtures/longSong.html`.
+
+Запуск: python benchmarks/lyricsPostProcessing.py [число повторов]
+"""
+
+import sys
+from pathlib import Path
+from timeit import repeat
+
+from geniux.lyricsParser import parseLyrics, toMarkdown
+
+page = (Path(__file__).parent.parent / "tests" / "fixtures" / "longSong.html").read_text()
+
+def measure(function: callable, number: int) -> float:
+    return min(repeat(function, number=number, repeat=5)) / number
+
+
+def main(number: int = 200) -> None:
+    lyricsHTML = parseLyrics(page, enhance=False)["html"]
+
+    for copies in (1, 10):
+        text = "\n\n".join([lyricsHTML] * copies)
+        print(f"{len(text):>8} chars   markdown {measure(lambda: toMarkdown(text), number) * 1000:>6.3f} ms   markdownV2 {measure(lambda: toMarkdown(text, v2=True), number) * 1000:>6.3f} ms")
+
+    parse = measure(lambda: parseLyrics(page), number // 10)
+    parseWithoutSections = measure(lambda: parseLyrics(page, removeSections=True), number // 10)
+    print(f"parseLyrics {parse * 1000:.2f} ms, with removeSections {parseWithoutSections * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
\ No newline at end of file
@@ -0,0 +1,51 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Сравнивает скорость извлечения текста песни из HTML-разметки и из встроенного JSON `__PRELOADED_STATE__` на странице `tests/fixtures/preloadedState.html`.
+
+Запуск: python benchmarks/lyricsSources.py [число повторов]
+"""
+
+import sys
+from importlib.util import find_spec
+from pathlib import Path
+from timeit import repeat
+
+from geniux.enums import LyricsSource
+from geniux.lyricsParser import parseLyrics, loadPreloadedState
+
+page = (Path(__file__).parent.parent / "tests" / "fixtures" / "preloadedState.html").read_text()
+
+def main(number: int = 50) -> None:
+    cases = {
+        "HTML": lambda: parseLyrics(page),
+        "PreloadedState": lambda: parseLyrics(page, source=LyricsSource.PreloadedState),
+        "state only": lambda: loadPreloadedState(page),
+    }
+    if find_spec("lxml"):
+        cases["HTML (lxml)"] = lambda: parseLyrics(page, parser="lxml")
+
+    print(f"page size: {len(page)}")
+    for name, case in cases.items():
+        timing = min(repeat(case, number=number, repeat=3)) / number
+        print(f"{name:<16}{timing * 1000:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
\ No newline at end of file
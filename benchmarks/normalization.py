@@ -0,0 +1,62 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Измеряет скорость нормализации названий и имён исполнителей на корпусе `tests/fixtures/names.json`. Корпус повторяется, как повторяются имена на страницах выдачи: «холодный» проход выполняется с пустым кэшем, «тёплый» — с заполненным.
+
+Запуск: python benchmarks/normalization.py [число повторов корпуса]
+"""
+
+import json
+import sys
+from pathlib import Path
+from time import perf_counter
+
+try:
+    from geniux.normalization import normalizeTitle, normalizeArtists
+
+except ImportError:
+    from geniux.utils import cleanTitle as normalizeTitle, cleanArtists as normalizeArtists
+
+corpus = json.loads((Path(__file__).parent.parent / "tests" / "fixtures" / "names.json").read_text())
+
+def clearCaches() -> None:
+    for function in (normalizeTitle, normalizeArtists):
+        if hasattr(function, "cache_clear"):
+            function.cache_clear()
+
+
+def run(function: callable, values: list, repeats: int) -> float:
+    started = perf_counter()
+    for _ in range(repeats):
+        for value in values:
+            function(value)
+
+    return (perf_counter() - started) / (repeats * len(values))
+
+
+def main(repeats: int = 1000) -> None:
+    for name, function, values in (("titles", normalizeTitle, list(corpus["titles"])), ("artists", normalizeArtists, list(corpus["artists"]))):
+        clearCaches()
+        cold = run(function, values, 1)
+        warm = run(function, values, repeats)
+        print(f"{name:<10}{len(values):>6} strings   cold {cold * 1e6:>7.2f} us   warm {warm * 1e6:>7.2f} us")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
\ No newline at end of file
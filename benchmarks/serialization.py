@@ -0,0 +1,52 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Измеряет время сериализации объекта `Track`, построенного из ответа `tests/fixtures/song.json`: `repr`, `toDict` и `toJSON`.
+
+Запуск: python benchmarks/serialization.py [число повторов]
+"""
+
+import json
+import sys
+from pathlib import Path
+from timeit import repeat
+
+from geniux import Client
+from geniux.types import Track
+
+payload = (Path(__file__).parent.parent / "tests" / "fixtures" / "song.json").read_text()
+
+def main(number: int = 500) -> None:
+    client = Client()
+    track = client._finalizeResponse(json.loads(payload), Track)
+
+    for name in ("__repr__", "toDict", "toJSON"):
+        method = getattr(track, name, None)
+        if method is None:
+            print(f"{name:<10}{'n/a':>12}")
+            continue
+
+        timing = min(repeat(method, number=number, repeat=5)) / number
+        print(f"{name:<10}{timing * 1000:>9.3f} ms")
+
+    client.close()
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
\ No newline at end of file
@@ -0,0 +1,82 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Измеряет время создания и память, занимаемую одним объектом `Track` со всеми вложенными объектами, построенным из ответа `tests/fixtures/song.json`. Учитывается и исходный ответ, если объект хранит ссылку на него.
+
+Запуск: python benchmarks/trackMemory.py [число треков]
+"""
+
+import gc
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+from time import perf_counter
+
+from geniux import Client
+from geniux.types import Track
+
+payload = (Path(__file__).parent.parent / "tests" / "fixtures" / "song.json").read_text()
+modes = {
+    "default": dict(),
+    "keepRaw=False": {"keepRaw": False},
+    "lazy=True": {"lazy": True},
+    "lazy=True, keepRaw=False": {"lazy": True, "keepRaw": False},
+}
+
+def measure(client: Client, count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    tracks = [client._finalizeResponse(json.loads(payload), Track) for _ in range(count)]
+
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del tracks
+    return (after - before) / count
+
+
+def construct(client: Client, count: int) -> float:
+    payloads = [json.loads(payload) for _ in range(count)]
+
+    started = perf_counter()
+    for item in payloads:
+        client._finalizeResponse(item, Track)
+
+    return (perf_counter() - started) / count
+
+
+def main(count: int = 2000) -> None:
+    for name, options in modes.items():
+        try:
+            client = Client(**options)
+
+        except TypeError:
+            print(f"{name:<28}{'n/a':>12}{'n/a':>12}")
+            continue
+
+        print(f"{name:<28}{measure(client, count):>10.0f} B{construct(client, count) * 1e6:>9.1f} us")
+        client.close()
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
\ No newline at end of file
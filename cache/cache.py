@@ -0,0 +1,97 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+import json
+from abc import ABC, abstractmethod
+from hashlib import sha256
+from time import time
+from urllib.parse import urlencode
+from typing import Union, Tuple, Any
+
+class Cache(ABC):
+    """
+    Базовый класс кэша ответов Genius API. Значения хранятся в сериализованном (JSON в UTF-8) виде, поэтому каждый запрос получает собственную копию ответа.
+
+    Аргументы:
+        ttl (float, optional): Время жизни записи в секундах по умолчанию.\n
+        ttls (dict, optional): Время жизни для отдельных эндпоинтов, например {"songs": 3600, "search": 60}. Ключ — первая часть пути запроса.\n
+        staleTTL (float, optional): Сколько секунд после истечения времени жизни запись ещё может быть отдана как устаревшая, пока клиент обновляет её в фоне.\n
+    """
+
+    def __init__(self, ttl: float = 300, ttls: dict = None, staleTTL: float = 0) -> None:
+        self.ttl = ttl
+        self.ttls = ttls or dict()
+        self.staleTTL = staleTTL
+
+        self.hits = 0
+        self.misses = 0
+
+
+    @staticmethod
+    def makeKey(path: str, params: dict = None, token: str = None) -> str:
+        key = path
+        if params:
+            key += "?" + urlencode(sorted((str(k), str(v)) for k, v in params.items()))
+
+        if token:
+            key += "#" + sha256(token.encode()).hexdigest()[:16]
+
+        return key
+
+
+    def getTTL(self, path: str) -> float:
+        return self.ttls.get(path.split("/", 1)[0], self.ttl)
+
+
+    def lookup(self, key: str) -> Union[Tuple[Any, bool], None]:
+        entry = self._get(key)
+        if entry is None:
+            self.misses += 1
+            return
+
+        payload, expiresAt = entry
+
+        self.hits += 1
+        return json.loads(payload), expiresAt <= time()
+
+
+    def get(self, key: str) -> Union[Any, None]:
+        entry = self.lookup(key)
+        return entry[0] if entry else None
+
+
+    def set(self, key: str, value: Any, ttl: float = None) -> None:
+        if value is None:
+            return
+
+        self._set(key, json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode(), self.ttl if ttl is None else ttl)
+
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+
+    @abstractmethod
+    def _get(self, key: str) -> Union[Tuple[bytes, float], None]:
+        pass
+
+
+    @abstractmethod
+    def _set(self, key: str, payload: bytes, ttl: float) -> None:
+        pass
\ No newline at end of file
@@ -0,0 +1,90 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+import threading
+from collections import OrderedDict
+from time import time
+from typing import Union, Tuple
+
+from .cache import Cache
+
+class MemoryCache(Cache):
+    """
+    Кэш в памяти процесса с ограничением по времени жизни записей и вытеснением давно не использованных записей (LRU) по их количеству и суммарному размеру.
+
+    Аргументы:
+        maxEntries (int, optional): Максимальное количество записей.\n
+        maxBytes (int, optional): Максимальный суммарный размер записей в байтах.\n
+        ttl (float, optional): Время жизни записи в секундах по умолчанию.\n
+        ttls (dict, optional): Время жизни для отдельных эндпоинтов, например {"songs": 3600, "search": 60}.\n
+        staleTTL (float, optional): Сколько секунд после истечения времени жизни запись ещё может быть отдана как устаревшая.\n
+    """
+
+    def __init__(self, maxEntries: int = 1024, maxBytes: int = 64 * 1024 * 1024, ttl: float = 300, ttls: dict = None, staleTTL: float = 0) -> None:
+        super().__init__(ttl, ttls, staleTTL)
+
+        self.maxEntries = maxEntries
+        self.maxBytes = maxBytes
+        self.size = 0
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+    def _get(self, key: str) -> Union[Tuple[bytes, float], None]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if not entry:
+                return
+
+            if entry[1] + self.staleTTL <= time():
+                self._pop(key)
+                return
+
+            self._entries.move_to_end(key)
+            return entry
+
+
+    def _set(self, key: str, payload: bytes, ttl: float) -> None:
+        if ttl <= 0 or len(payload) > self.maxBytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+
+            self._entries[key] = (payload, time() + ttl)
+            self.size += len(payload)
+
+            while len(self._entries) > self.maxEntries or self.size > self.maxBytes:
+                self._pop(next(iter(self._entries)))
+
+
+    def _pop(self, key: str) -> None:
+        payload, _ = self._entries.pop(key)
+        self.size -= len(payload)
\ No newline at end of file
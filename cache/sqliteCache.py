@@ -0,0 +1,127 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+import sqlite3
+import threading
+from time import time
+from typing import Union, Tuple
+
+from .cache import Cache
+
+class SQLiteCache(Cache):
+    """
+    Кэш в файле SQLite (режим WAL), который могут одновременно использовать несколько процессов. При превышении `maxBytes` вытесняются давно не использованные записи; время последнего обращения обновляется не чаще раза в `touchInterval` секунд, чтобы чтение почти никогда не требовало записи в файл.
+
+    Аргументы:
+        path (str): Путь к файлу базы данных.\n
+        maxBytes (int, optional): Максимальный суммарный размер записей в байтах.\n
+        ttl (float, optional): Время жизни записи в секундах по умолчанию.\n
+        ttls (dict, optional): Время жизни для отдельных эндпоинтов, например {"songs": 3600, "lyrics": 86400}.\n
+        staleTTL (float, optional): Сколько секунд после истечения времени жизни запись ещё может быть отдана как устаревшая.\n
+    """
+
+    evictionInterval = 64
+    touchInterval = 60
+
+    def __init__(self, path: str, maxBytes: int = 256 * 1024 * 1024, ttl: float = 300, ttls: dict = None, staleTTL: float = 0) -> None:
+        super().__init__(ttl, ttls, staleTTL)
+
+        self.path = path
+        self.maxBytes = maxBytes
+
+        self._lock = threading.Lock()
+        self._writes = 0
+
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, payload TEXT NOT NULL, expiresAt REAL NOT NULL, accessedAt REAL NOT NULL, size INTEGER NOT NULL)")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS entriesAccessedAt ON entries (accessedAt)")
+
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM entries")
+
+
+    def _get(self, key: str) -> Union[Tuple[bytes, float], None]:
+        now = time()
+
+        with self._lock:
+            entry = self._connection.execute("SELECT payload, expiresAt, accessedAt FROM entries WHERE key = ?", (key,)).fetchone()
+            if not entry:
+                return
+
+            payload, expiresAt, accessedAt = entry
+            if expiresAt + self.staleTTL <= now:
+                self._connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+                return
+
+            if now - accessedAt >= self.touchInterval:
+                self._connection.execute("UPDATE entries SET accessedAt = ? WHERE key = ?", (now, key))
+
+            return payload, expiresAt
+
+
+    def _set(self, key: str, payload: bytes, ttl: float) -> None:
+        if ttl <= 0 or len(payload) > self.maxBytes:
+            return
+
+        now = time()
+
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries (key, payload, expiresAt, accessedAt, size) VALUES (?, ?, ?, ?, ?)",
+                (key, payload, now + ttl, now, len(payload)),
+            )
+
+            self._writes += 1
+            if (self._writes - 1) % self.evictionInterval == 0:
+                self._evict(now)
+
+
+    def _evict(self, now: float) -> None:
+        self._connection.execute("DELETE FROM entries WHERE expiresAt + ? <= ?", (self.staleTTL, now))
+
+        size = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if size <= self.maxBytes:
+            return
+
+        excess = size - self.maxBytes
+        freed = 0
+        keys = list()
+
+        cursor = self._connection.execute("SELECT key, size FROM entries ORDER BY accessedAt")
+        for key, entrySize in cursor:
+            keys.append((key,))
+            freed += entrySize
+            if freed >= excess:
+                break
+
+        cursor.close()
+        self._connection.executemany("DELETE FROM entries WHERE key = ?", keys)
\ No newline at end of file
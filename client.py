@@ -17,20 +17,35 @@
 #  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
 
 import asyncio
+from collections import OrderedDict
+from weakref import WeakValueDictionary
+from contextlib import contextmanager
+from contextvars import ContextVar
+from json import dumps, loads
 
 from httpx import AsyncClient
 from typing import Union, List, Type, Any
 
-from geniux.aio import asyncFunction
+from geniux.aio import asyncFunction, getLoop
 from geniux.config import GeniusAPI
 from geniux.errors import *
 
 from geniux.webClient import Client as WebClient
+from geniux.rateLimiter import RateLimiter
+from geniux.cache import Cache
+from geniux.lyricsParser import resolveParser
 
 from geniux.methods import *
-from geniux.enums import Language
+from geniux.methods import _Paginate, _Batch
+from geniux.enums import Language, LyricsSource
+
+keepRawOverrides = ContextVar("keepRawOverrides", default=dict())
+contextKeys = ("role", "annotationImpact", "answerImpact")
 
 class Client(
+    _Paginate,
+    _Batch,
+
     Searching,
     Artists,
     Albums,
@@ -46,6 +61,16 @@ class Client(
         token (str, optional): Токен доступа к Genius API. Требуется для некоторых методов.\n
         language (Language, optional): Язык ошибок (например, `Language.Russian` для русского, `Language.English` для английского). Если не указан, используются все языки.\n
         proxies (dict, optional): прокси, которые будут использоваться при запросах. Формат {"протокол": "логин:пароль@IP:порт"}\n
+        rateLimit (float, optional): Максимальное число запросов в секунду к одному хосту. Если не указано, частота не ограничивается.\n
+        maxConcurrency (int, optional): Верхний предел числа одновременных запросов. Фактический предел подстраивается автоматически: уменьшается при ответах 429/5xx и растёт при успешных ответах.\n
+        cache (Cache, optional): Кэш ответов Genius API и текстов песен, например `MemoryCache(maxEntries=10000, ttls={"songs": 3600})` или `SQLiteCache("geniux.db", staleTTL=86400)` из `geniux.cache`. Устаревшие записи в пределах `staleTTL` отдаются сразу и обновляются в фоне. Если не указан, ответы не кэшируются.\n
+        lyricsParser (str, optional): Парсер BeautifulSoup для извлечения текстов песен: `"html.parser"` (по умолчанию) или `"lxml"`, если он установлен.\n
+        keepRaw (bool, optional): Сохранять ли исходный ответ Genius в атрибуте `raw` каждого объекта. По умолчанию `True`; `False` вдвое сокращает память, занимаемую объектами. Для отдельных вызовов можно переопределить через `rawPayloads`.\n
+        lyricsSource (LyricsSource, optional): Откуда извлекать тексты песен: `LyricsSource.HTML` (по умолчанию) разбирает HTML страницы, `LyricsSource.PreloadedState` декодирует встроенный в страницу JSON, что значительно быстрее. Если JSON не найден, используется разбор HTML.\n
+        streamLyrics (bool, optional): Загружать ли страницу с текстом песни потоково, прекращая чтение сразу после закрытия элемента с текстом. Сокращает объём загружаемых данных. По умолчанию `False`.\n
+        lazy (bool, optional): Создавать ли вложенные объекты трека (исполнителей, альбомы, жанры, статистику, текст и т. д.) только при первом обращении к ним. По умолчанию `False`. Полезно, когда из результатов поиска нужны лишь название и идентификатор. Пока не построены все вложенные объекты, трек хранит ссылку на исходный ответ даже при `keepRaw=False`; после этого ссылка освобождается.\n
+        identityMap (bool, optional): Возвращать ли один и тот же объект для одного и того же исполнителя, пользователя или альбома во всех ответах, пока на него есть ссылки. Более полные данные дополняют уже созданный объект. По умолчанию `False`.\n
+        checkForUpdates (bool, optional): Проверять ли наличие новой версии библиотеки в фоне при создании клиента. По умолчанию `False`: конструктор не выполняет сетевых запросов.\n
 
     Пример использования:
         from geniux.enums import Language
@@ -54,8 +79,9 @@ class Client(
         print(result)
     """
 
+    _trackURLCacheSize = 100000
 
-    def __init__(self, token: str = None, language: Language = None, proxies: dict = None) -> None:
+    def __init__(self, token: str = None, language: Language = None, proxies: dict = None, checkForUpdates: bool = False, rateLimit: float = None, maxConcurrency: int = None, cache: Cache = None, lyricsParser: str = None, keepRaw: bool = True, lazy: bool = False, identityMap: bool = False, streamLyrics: bool = False, lyricsSource: LyricsSource = LyricsSource.HTML) -> None:
         self._token = token
         self._language = language if language and isinstance(language, Language) else None
 
@@ -89,35 +115,47 @@ class Client(
                 UserWarning
             )
 
-        self._proxySession = AsyncClient(proxies=self._proxies)
-        self._proxyClient = WebClient(self._proxySession)
+        self._rateLimiter = RateLimiter(rateLimit, maxConcurrency) if rateLimit or maxConcurrency else None
+        self._cache = cache
+        self._revalidating = dict()
+        self._inFlight = dict()
+        self._lyricsParser = resolveParser(lyricsParser)
+        self._streamLyrics = streamLyrics
+        self._lyricsSource = lyricsSource if isinstance(lyricsSource, LyricsSource) else LyricsSource.HTML
+        self._trackURLs = OrderedDict()
+        self._keepRaw = keepRaw
+        self._lazy = lazy
+        self._identities = WeakValueDictionary() if identityMap else None
 
-        self._session = AsyncClient(proxies=None)
-        self._client = WebClient(self._session)
+        self._openSessions()
 
         self._closed = False
 
-        try:
-            asyncio.get_running_loop()
+        if checkForUpdates:
+            self._updateCheck = self._scheduleUpdateCheck()
 
-        except RuntimeError:
-            from .version import __version__
-            from packaging import version
 
-            latestVersion = self._client.req("https://pypi.org/pypi/geniux/json").get("info").get("version")
+    def _scheduleUpdateCheck(self) -> Any:
+        async def check() -> None:
+            try:
+                await self.checkUpdates()
+
+            except Exception:
+                pass
 
-            if version.parse(latestVersion) > version.parse(__version__):
-                ruWarning = f"Внимание: Доступна новая версия библиотеки {latestVersion} (https://pypi.org/project/geniux). Вы используете версию {__version__}."
-                enWarning = f"Attention: A new version of the library {latestVersion} (https://pypi.org/project/geniux) is available. You are using version {__version__}."
+        try:
+            return asyncio.get_running_loop().create_task(check())
 
-                from warnings import warn
-                warn(
-                    ruWarning if self._language == Language.Russian else (enWarning if self._language == Language.English else "🇷🇺: " + ruWarning + " 🇬🇧: " + enWarning),
-                    UserWarning
-                )
+        except RuntimeError:
+            return asyncio.run_coroutine_threadsafe(check(), getLoop())
 
 
+    @asyncFunction
     async def checkUpdates(self) -> None:
+        """
+        Проверяет наличие новой версии библиотеки на PyPI и выводит предупреждение, если она доступна.
+        """
+
         if self._closed:
             self._raiseError("sessionClosed")
 
@@ -187,10 +225,40 @@ class Client(
             return
 
         self._closed = False
+        self._openSessions()
+
+
+    @contextmanager
+    def rawPayloads(self, keep: bool = True) -> Any:
+        """
+        Переопределяет параметр `keepRaw` этого клиента для вызовов внутри блока `with`, в том числе асинхронных. Другие клиенты продолжают использовать собственные настройки.
+
+        Аргументы:
+            keep (bool, optional): Сохранять ли исходный ответ в атрибуте `raw` создаваемых объектов.
+
+        Пример использования:
+            with client.rawPayloads(False):
+                tracks = client.searchTracks("New Sylveon")
+        """
+
+        token = keepRawOverrides.set({**keepRawOverrides.get(), self: keep})
+        try:
+            yield self
+
+        finally:
+            keepRawOverrides.reset(token)
+
+
+    def _keepsRaw(self) -> bool:
+        return keepRawOverrides.get().get(self, self._keepRaw)
+
+
+    def _openSessions(self) -> None:
         self._proxySession = AsyncClient(proxies=self._proxies)
-        self._proxyClient = WebClient(self._proxySession)
+        self._proxyClient = WebClient(self._proxySession, self._rateLimiter, self._raiseError)
+
         self._session = AsyncClient(proxies=None)
-        self._client = WebClient(self._session)
+        self._client = WebClient(self._session, self._rateLimiter, self._raiseError)
 
 
     async def _req(self, method: str, params: dict = None, HTTPMethod: str = "GET") -> Union[dict, None]:
@@ -203,6 +271,22 @@ class Client(
         else:
             params = {k: v for k, v in params.items() if v is not None}
 
+        if HTTPMethod != "GET":
+            return await self._fetch(method, params, HTTPMethod)
+
+        key = Cache.makeKey(method, params, self._token)
+        cacheKey = key if self._cache is not None else None
+        fetch = lambda: self._singleFlight(key, lambda: self._fetch(method, params, HTTPMethod, cacheKey))
+
+        if cacheKey:
+            cached = self._fromCache(cacheKey, fetch)
+            if cached is not None:
+                return cached
+
+        return await fetch()
+
+
+    async def _fetch(self, method: str, params: dict, HTTPMethod: str = "GET", cacheKey: str = None) -> Union[dict, None]:
         fullParams = {
             **params,
             **(
@@ -222,9 +306,88 @@ class Client(
         if isinstance(req, list) and len(req) == 1:
             req = req[0]
 
+        if cacheKey:
+            self._cache.set(cacheKey, req, self._cache.getTTL(method))
+
         return req
 
 
+    async def _singleFlight(self, key: str, fetch: callable) -> Any:
+        loop = asyncio.get_running_loop()
+        flightKey = (loop, key)
+
+        flight = self._inFlight.get(flightKey)
+        if flight:
+            future = flight[0]
+            flight[1] += 1
+
+            try:
+                payload = await asyncio.shield(future)
+
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+
+                return await self._singleFlight(key, fetch)
+
+            return loads(payload) if payload is not None else None
+
+        future = loop.create_future()
+        flight = self._inFlight[flightKey] = [future, 0]
+
+        try:
+            result = await fetch()
+
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+
+        except BaseException as error:
+            if flight[1]:
+                future.set_exception(error)
+
+            raise
+
+        finally:
+            self._inFlight.pop(flightKey, None)
+
+        if flight[1]:
+            future.set_result(dumps(result) if result is not None else None)
+
+        return result
+
+
+    def _fromCache(self, cacheKey: str, refresh: callable) -> Union[Any, None]:
+        entry = self._cache.lookup(cacheKey)
+        if not entry:
+            return
+
+        value, stale = entry
+        if stale and cacheKey not in self._revalidating:
+            task = asyncio.ensure_future(refresh())
+            self._revalidating[cacheKey] = task
+
+            def done(task: asyncio.Task) -> None:
+                self._revalidating.pop(cacheKey, None)
+                if not task.cancelled():
+                    task.exception()
+
+            task.add_done_callback(done)
+
+        return value
+
+
+    def _rememberTrackURL(self, id: int, url: str) -> None:
+        if not id or not url:
+            return
+
+        self._trackURLs[id] = url
+        self._trackURLs.move_to_end(id)
+
+        if len(self._trackURLs) > self._trackURLCacheSize:
+            self._trackURLs.popitem(last=False)
+
+
     def _raiseError(self, errorType: Union[str, None]) -> None:
         if not errorType:
             return
@@ -247,6 +410,7 @@ class Client(
             "needsTrackIdOrTrackParameterNotBoth": NeedsTrackIdOrTrackParameterNotBoth,
 
             "tooHighRequestSendingRate": TooHighRequestSendingRate,
+            "retriesExhausted": RetriesExhausted,
 
             "invalidProxyType": InvalidProxyType,
             "invalidProxyDict": InvalidProxyDict,
@@ -271,10 +435,31 @@ class Client(
         raise error
 
 
+    def _construct(self, obj: dict, objectType: Type[Any]) -> Any:
+        if self._identities is None or not getattr(objectType, "_shared", False) or not isinstance(obj, dict) or obj.get("id") is None or any(key in obj for key in contextKeys):
+            return objectType(obj, client=self)
+
+        key = (objectType, obj.get("id"))
+        entity = self._identities.get(key)
+        if entity is not None and entity._payloadKeys.issuperset(obj):
+            return entity
+
+        fresh = objectType(obj, client=self)
+        fresh._payloadKeys = frozenset(obj)
+        if entity is None:
+            self._identities[key] = fresh
+            return fresh
+
+        entity._merge(fresh)
+        entity._payloadKeys |= fresh._payloadKeys
+
+        return entity
+
+
     def _finalizeResponse(self, response: Union[List[dict], dict], objectType: Type[Any]) -> Union[List[Any], None]:
         if not (response or response is False):
             return
 
-        response = [objectType(obj, client=self) for obj in (response if isinstance(response, list) else [response])]
+        response = [self._construct(obj, objectType) for obj in (response if isinstance(response, list) else [response])]
 
         return response if len(response) > 1 else response[0]
\ No newline at end of file
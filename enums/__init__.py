@@ -20,4 +20,5 @@ from .language import Language
 from .sort import Sort
 from .textFormat import TextFormat
 from .role import Role
-from .color import Color
\ No newline at end of file
+from .color import Color
+from .lyricsSource import LyricsSource
\ No newline at end of file
@@ -34,6 +34,7 @@ from .needsTrackIdOrTrackParameter import NeedsTrackIdOrTrackParameter
 from .needsTrackIdOrTrackParameterNotBoth import NeedsTrackIdOrTrackParameterNotBoth
 
 from .tooHighRequestSendingRate import TooHighRequestSendingRate
+from .retriesExhausted import RetriesExhausted
 
 from .invalidProxyType import InvalidProxyType
 from .invalidProxyDict import InvalidProxyDict
\ No newline at end of file
@@ -0,0 +1,388 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+import re
+from ast import literal_eval
+from html import escape, unescape
+from importlib.util import find_spec
+from json import loads
+from typing import Union, Tuple
+from warnings import catch_warnings, simplefilter
+
+from bs4 import BeautifulSoup
+
+from .enums import LyricsSource
+from .lyricsStructure import LyricsStructure
+from .utils import clean
+
+tagPattern = re.compile(r"<!--.*?-->|<(script|style)\b.*?</\1\s*>|<(/?)div\b([^>]*)>", re.IGNORECASE | re.DOTALL)
+tagStartPattern = re.compile(r"<(?:(!--)|(script|style)\b|/?div\b)", re.IGNORECASE)
+skippedEndPatterns = {
+    "!--": re.compile(r"-->"),
+    "script": re.compile(r"</script\s*>", re.IGNORECASE),
+    "style": re.compile(r"</style\s*>", re.IGNORECASE),
+}
+classAttributePattern = re.compile(r"\bclass\s*=\s*(?:\"([^\"]*)\"|'([^']*)'|([^\s>]+))", re.IGNORECASE)
+rootClassPattern = re.compile(r"^lyrics$|Lyrics__Root")
+
+serviceContainerPattern = re.compile(r"^(Pyong|LyricsFooter|LyricsHeader)__Container")
+adClassesPattern = re.compile(r"(DfpAd__Container|SidebarAd__Container|SidebarAd__StickyContainer|RightSidebar__Container|InreadContainer__Container)")
+keywordPatterns = tuple(re.compile(keyword) for keyword in ("You might also like", "Embed"))
+lyricsContainerPattern = re.compile(r"^Lyrics__Container")
+referentPattern = re.compile(r'<a class="ReferentFragmentdesktop__ClickTarget.*?" href=".*?(/|.*?)"><span class="ReferentFragmentdesktop__Highlight.*?">(.*?)</span></a>', re.DOTALL)
+emptySpanPattern = re.compile(r'<span style=".*".*></span>')
+instrumentalMarker = '<div class="LyricsPlaceholder__Message-uen8er-2 gotKKY">This song is an instrumental</div>'
+
+preloadedStatePattern = re.compile(r"""window\.__PRELOADED_STATE__\s*=\s*JSON\.parse\(\s*(['"])""")
+stateTagPattern = re.compile(r"(<[^>]*>)")
+stateLineBreakPattern = re.compile(r"<br\s*/?>\n?", re.IGNORECASE)
+stateParagraphPattern = re.compile(r"</p>\s*<p\b[^>]*>", re.IGNORECASE)
+stateKeptTagPattern = re.compile(r"</?[bi]>")
+
+markdownSpecialCharacters = "\\_*~`#+|{}"
+boldPattern = re.compile(r"<b>(.*?)</b>", re.DOTALL)
+italicPattern = re.compile(r"<i>(.*?)</i>", re.DOTALL)
+
+lyricsFormats = ("plain", "markdown", "markdownV2")
+
+parsers = {
+    "html.parser": None,
+    "lxml": "lxml",
+    "html5lib": "html5lib",
+}
+
+def resolveParser(parser: Union[str, None]) -> str:
+    """
+    Возвращает имя парсера BeautifulSoup, который будет использоваться для извлечения текста песни. Если нужный модуль не установлен, используется встроенный `html.parser`.
+    """
+
+    if not parser or parser not in parsers:
+        return "html.parser"
+
+    module = parsers.get(parser)
+    return parser if not module or find_spec(module) else "html.parser"
+
+
+def findLyricsRoot(text: str) -> Union[Tuple[int, int], None]:
+    """
+    Находит границы элемента `Lyrics__Root` в HTML-коде страницы за один проход по тегам `div`, не строя дерево документа.
+    """
+
+    scanner = LyricsRootScanner()
+    for tag in tagPattern.finditer(text):
+        if scanner.handle(tag):
+            return scanner.start, scanner.end
+
+    return
+
+
+class LyricsRootScanner:
+    """
+    Ищет элемент `Lyrics__Root` в HTML-коде, поступающем частями, чтобы прекратить загрузку страницы сразу после его закрытия. До начала элемента хранится только ещё не разобранный хвост текста, а комментарии, `<script>` и `<style>` пропускаются без накопления их содержимого.
+    """
+
+    tailSize = 16
+
+    def __init__(self) -> None:
+        self.text = str()
+        self.position = 0
+        self.depth = 0
+        self.start = None
+        self.end = None
+        self.skipping = None
+
+
+    @property
+    def done(self) -> bool:
+        return self.end is not None
+
+
+    def feed(self, chunk: str) -> bool:
+        self.text += chunk
+
+        while not self.done:
+            if self.skipping:
+                skippedEnd = self.skipping.search(self.text, self.position)
+                if not skippedEnd:
+                    self.position = max(self.position, len(self.text) - self.tailSize)
+                    break
+
+                self.position = skippedEnd.end()
+                self.skipping = None
+                continue
+
+            tagStart = tagStartPattern.search(self.text, self.position)
+            if not tagStart:
+                self.position = max(self.position, len(self.text) - self.tailSize)
+                break
+
+            if tagStart.end() == len(self.text):
+                self.position = tagStart.start()
+                break
+
+            skipped = tagStart.group(1) or tagStart.group(2)
+            if skipped:
+                self.skipping = skippedEndPatterns[skipped.lower()]
+                self.position = tagStart.end()
+                continue
+
+            tag = tagPattern.match(self.text, tagStart.start())
+            if not tag:
+                self.position = tagStart.start()
+                break
+
+            self.position = tag.end()
+            self.handle(tag)
+
+        self.trim()
+        return self.done
+
+
+    def trim(self) -> None:
+        offset = self.position if self.start is None else self.start
+        if not offset:
+            return
+
+        self.text = self.text[offset:]
+        self.position -= offset
+        if self.start is not None:
+            self.start = 0
+
+        if self.end is not None:
+            self.end -= offset
+
+
+    def handle(self, tag: re.Match) -> bool:
+        if tag.group(1):
+            return False
+
+        if self.start is not None:
+            self.depth += -1 if tag.group(2) else 1
+            if not self.depth:
+                self.end = tag.end()
+                return True
+
+            return False
+
+        if tag.group(2) or not tag.group(3):
+            return False
+
+        classes = classAttributePattern.search(tag.group(3))
+        if classes and any(rootClassPattern.search(class_) for class_ in (classes.group(1) or classes.group(2) or classes.group(3)).split()):
+            self.start = tag.start()
+            self.depth = 1
+
+        return False
+
+
+    def result(self) -> str:
+        return self.text[self.start:self.end] if self.done else self.text
+
+
+def parseLyrics(text: str, removeSections: bool = False, enhance: bool = True, parser: str = "html.parser", source: LyricsSource = LyricsSource.HTML) -> Union[dict, None]:
+    """
+    Извлекает текст песни из HTML-кода страницы Genius. Разбирается только фрагмент с элементом `Lyrics__Root`; если его границы определить не удалось, разбирается вся страница.
+
+    При `source=LyricsSource.PreloadedState` текст сначала берётся из встроенного в страницу JSON `__PRELOADED_STATE__`, а HTML разбирается, только если его там нет.
+    """
+
+    if source == LyricsSource.PreloadedState:
+        lyrics = parsePreloadedState(text, removeSections, enhance)
+        if lyrics is not None:
+            return lyrics
+
+    bounds = findLyricsRoot(text)
+    if bounds:
+        text = text[bounds[0]:bounds[1]]
+
+    text = text.replace("<br/>", "\n")
+
+    soup = BeautifulSoup(text, parser)
+    div = soup.find("div", class_=rootClassPattern)
+    if div is None:
+        return
+
+    lyricsContent = div.extract()
+
+    for div in lyricsContent.find_all("div", class_=serviceContainerPattern):
+        div.decompose()
+
+    for adBlock in lyricsContent.find_all(class_=adClassesPattern):
+        adBlock.replace_with(str())
+
+    for keywordPattern in keywordPatterns:
+        for block in lyricsContent.find_all(string=keywordPattern):
+            block.parent.replace_with(str())
+
+    for container in lyricsContent.find_all("div", class_=lyricsContainerPattern):
+        container.insert_before("\n")
+        container.unwrap()
+
+    lyricsContent = str(lyricsContent)
+    lyricsContent = lyricsContent.replace("  ", " ")
+    lyricsContent = referentPattern.sub(r"\2", lyricsContent)
+    lyricsContent = emptySpanPattern.sub(str(), lyricsContent)
+    lyricsContent = lyricsContent[lyricsContent.find(">") + 2:lyricsContent.rfind("</div>")]
+
+    lyricsHTML = clean(lyricsContent)
+
+    return finishLyrics(lyricsHTML, instrumentalMarker in lyricsHTML, removeSections, enhance)
+
+
+def parseLyricsPage(text: str, removeSections: bool = False, enhance: bool = True, parser: str = "html.parser", source: LyricsSource = LyricsSource.HTML, formats: Tuple[str, ...] = lyricsFormats) -> Union[dict, None]:
+    """
+    Извлекает текст песни так же, как `parseLyrics`, и сразу переводит его в запрошенные форматы. Используется в пуле процессов, чтобы родительскому процессу оставалось только создать объекты.
+    """
+
+    lyrics = parseLyrics(text, removeSections, enhance, parser, source)
+    return renderLyrics(lyrics, formats) if lyrics is not None else None
+
+
+def renderLyrics(lyrics: dict, formats: Tuple[str, ...] = lyricsFormats) -> dict:
+    """
+    Дополняет результат `parseLyrics` текстом в форматах `formats` (`plain`, `markdown`, `markdownV2`), которых в нём ещё нет.
+    """
+
+    lyricsHTML = lyrics.get("html")
+    if lyricsHTML is None:
+        return lyrics
+
+    for textFormat in formats:
+        if textFormat in lyrics:
+            continue
+
+        if textFormat == "plain":
+            lyrics[textFormat] = toPlain(lyricsHTML)
+
+        elif textFormat in ("markdown", "markdownV2"):
+            lyrics[textFormat] = toMarkdown(lyricsHTML, v2=textFormat == "markdownV2")
+
+    return lyrics
+
+
+def parsePreloadedState(text: str, removeSections: bool = False, enhance: bool = True) -> Union[dict, None]:
+    """
+    Извлекает текст песни из JSON `window.__PRELOADED_STATE__`, встроенного в страницу Genius, без построения дерева HTML. Возвращает `None`, если состояние не найдено или не содержит текста.
+    """
+
+    state = loadPreloadedState(text)
+    lyricsData = (state.get("songPage") or dict()).get("lyricsData") if isinstance(state, dict) else None
+    if not isinstance(lyricsData, dict):
+        return
+
+    body = (lyricsData.get("body") or dict()).get("html")
+    instrumental = lyricsData.get("lyricsPlaceholderReason") == "instrumental"
+    if not body and not instrumental:
+        return
+
+    return finishLyrics(stateBodyToLyricsHTML(body) if body else None, instrumental, removeSections, enhance)
+
+
+def loadPreloadedState(text: str) -> Union[dict, None]:
+    index = text.find("window.__PRELOADED_STATE__")
+    if index == -1:
+        return
+
+    match = preloadedStatePattern.match(text, index)
+    if not match:
+        return
+
+    quote = match.group(1)
+    start = end = match.end()
+    while True:
+        end = text.find(quote, end)
+        if end == -1:
+            return
+
+        backslashes = 0
+        while text[end - backslashes - 1] == "\\":
+            backslashes += 1
+
+        if not backslashes % 2:
+            break
+
+        end += 1
+
+    try:
+        with catch_warnings():
+            simplefilter("ignore")
+            state = literal_eval(quote + text[start:end] + quote)
+
+        return loads(state.encode("utf-16", "surrogatepass").decode("utf-16"), strict=False)
+
+    except (SyntaxError, ValueError):
+        return
+
+
+def stateBodyToLyricsHTML(body: str) -> str:
+    body = stateLineBreakPattern.sub("\n", body)
+    body = stateParagraphPattern.sub("\n\n", body)
+
+    parts = stateTagPattern.split(body)
+    for index, part in enumerate(parts):
+        if index % 2:
+            parts[index] = part if stateKeptTagPattern.fullmatch(part) else str()
+
+        elif part:
+            parts[index] = escape(unescape(part), quote=False)
+
+    return clean("".join(parts).replace("  ", " "))
+
+
+def finishLyrics(lyricsHTML: Union[str, None], instrumental: bool, removeSections: bool, enhance: bool) -> dict:
+    if not instrumental:
+        if enhance:
+            lyricsHTML = lyricsHTML.replace("\n\n\n", "\n\n")
+
+            lines = lyricsHTML.split("\n")
+            if lines and len(lines) >= 2 and "текст песни" in lines[0].lower() and not lines[1].strip():
+                for _ in range(2):
+                    lines.pop(0)
+
+            lyricsHTML = "\n".join(lines)
+
+        if removeSections:
+            lyricsHTML = LyricsStructure(lyricsHTML).withoutSections()
+
+    return {
+        **(
+            {
+                "html": lyricsHTML,
+            }
+            if not instrumental else dict()
+        ),
+        "instrumental": instrumental,
+    }
+
+
+def toMarkdown(lyricsHTML: str, v2: bool = False) -> str:
+    """
+    Переводит HTML текста песни в Markdown. Служебные символы экранируются через `str.replace` (обратная косая черта — первой), после чего `<b>` и `<i>` заменяются двумя проходами скомпилированных выражений (`__` для `<i>` в MarkdownV2).
+    """
+
+    for character in markdownSpecialCharacters:
+        if character in lyricsHTML:
+            lyricsHTML = lyricsHTML.replace(character, "\\" + character)
+
+    lyricsMarkdown = boldPattern.sub(r"**\1**", lyricsHTML)
+
+    return italicPattern.sub(r"__\1__" if v2 else r"*\1*", lyricsMarkdown)
+
+
+def toPlain(lyricsHTML: str) -> str:
+    return BeautifulSoup(lyricsHTML, "html.parser").get_text()
\ No newline at end of file
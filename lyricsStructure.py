@@ -0,0 +1,206 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+import re
+from typing import Union, List, Tuple
+
+sectionPattern = re.compile(r"(?:\n\n|\A)\[([^\[\]\?]+)\]\n")
+sectionNumberPattern = re.compile(r"\s*\d+$")
+
+class LyricsLine:
+    """
+    Строка текста песни с границами `[start, end)` в исходном тексте и индексом секции, к которой она относится.
+    """
+
+    __slots__ = ("text", "start", "end", "section")
+
+    def __init__(self, text: str, start: int, end: int, section: int) -> None:
+        self.text = text
+        self.start = start
+        self.end = end
+        self.section = section
+
+
+    def __repr__(self) -> str:
+        return f"LyricsLine({self.text!r}, start={self.start}, end={self.end})"
+
+
+class LyricsSection:
+    """
+    Секция текста песни (`[Припев: Исполнитель]`). `start` указывает на начало заголовка, `bodyStart` — на первый символ после него, `end` — на конец последней строки секции. У секции, идущей до первого заголовка, `header` равен `None`.
+    """
+
+    __slots__ = ("header", "name", "performer", "start", "bodyStart", "end", "lines")
+
+    def __init__(self, header: Union[str, None], start: int, bodyStart: int) -> None:
+        name, _, performer = header.partition(":") if header else (str(), str(), str())
+
+        self.header = header
+        self.name = name.strip() or None
+        self.performer = performer.strip() or None
+        self.start = start
+        self.bodyStart = bodyStart
+        self.end = bodyStart
+        self.lines = ()
+
+
+    def __repr__(self) -> str:
+        return f"LyricsSection({self.header!r}, start={self.start}, end={self.end}, lines={len(self.lines)})"
+
+
+class LyricsStructure:
+    """
+    Разбор текста песни на секции и строки. Заголовки секций находятся одним проходом `sectionPattern` при создании — по тому же правилу, что и при `removeSections=True`; секции, строки и индекс названий строятся при первом обращении к ним. Поиск секции, выборка строк и удаление заголовков работают по готовым индексам.
+    """
+
+    __slots__ = ("text", "_headers", "_sections", "_lines", "_index", "_withoutSections")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self._headers = [(match.start(), match.start(1) - 1, match.end(), match.group(1)) for match in sectionPattern.finditer(text)]
+        self._sections = None
+        self._lines = None
+        self._index = None
+        self._withoutSections = None
+
+
+    @property
+    def sections(self) -> Tuple[LyricsSection, ...]:
+        if self._sections is None:
+            self._build()
+
+        return self._sections
+
+
+    @property
+    def lines(self) -> Tuple[LyricsLine, ...]:
+        if self._lines is None:
+            self._build()
+
+        return self._lines
+
+
+    def _build(self) -> None:
+        text = self.text
+        headers = iter(self._headers)
+        header = next(headers, None)
+
+        sections = list()
+        lines = list()
+        sectionLines = list()
+        section = None
+        index = dict()
+
+        position = 0
+        length = len(text)
+        while position < length:
+            if header and position >= header[1]:
+                if section:
+                    section.lines = tuple(sectionLines)
+
+                section = LyricsSection(header[3], header[1], header[2])
+                sections.append(section)
+                self._addToIndex(index, section, len(sections) - 1)
+                sectionLines = list()
+
+                position = header[2]
+                header = next(headers, None)
+                continue
+
+            end = text.find("\n", position)
+            if end == -1:
+                end = length
+
+            line = text[position:end]
+            if line.strip():
+                if not section:
+                    section = LyricsSection(None, position, position)
+                    sections.append(section)
+
+                line = LyricsLine(line, position, end, len(sections) - 1)
+                lines.append(line)
+                sectionLines.append(line)
+                section.end = end
+
+            position = end + 1
+
+        if section:
+            section.lines = tuple(sectionLines)
+
+        self._sections = tuple(sections)
+        self._lines = tuple(lines)
+        self._index = index
+
+
+    @staticmethod
+    def _addToIndex(index: dict, section: LyricsSection, position: int) -> None:
+        keys = {section.header.strip().casefold()}
+        if section.name:
+            name = section.name.casefold()
+            keys.update((name, sectionNumberPattern.sub(str(), name)))
+
+        keys.discard(str())
+        for key in keys:
+            index.setdefault(key, list()).append(position)
+
+
+    def section(self, name: str) -> List[LyricsSection]:
+        """
+        Возвращает секции с указанным названием без учёта регистра. Подходит как полный заголовок (`Куплет 1: Исполнитель`), так и название с номером (`Куплет 1`) или без него (`Куплет`).
+
+        Аргументы:
+            name (str): Название секции.
+        """
+
+        if self._index is None:
+            self._build()
+
+        return [self._sections[index] for index in self._index.get(name.strip().casefold(), ())]
+
+
+    def getLines(self, start: int = None, stop: int = None) -> str:
+        """
+        Возвращает строки текста с `start` по `stop` (не включая) без заголовков секций и пустых строк.
+
+        Аргументы:
+            start (int, optional): Индекс первой строки.
+            stop (int, optional): Индекс строки, на которой выборка заканчивается.
+        """
+
+        return "\n".join(line.text for line in self.lines[start:stop])
+
+
+    def withoutSections(self) -> str:
+        """
+        Возвращает текст без заголовков секций. Результат совпадает с `removeSections=True`: найденные при создании заголовки вырезаются по их границам, без повторного прохода регулярным выражением.
+        """
+
+        if self._withoutSections is None:
+            parts = list()
+            position = 0
+            for matchStart, _, matchEnd, _ in self._headers:
+                parts.append(self.text[position:matchStart])
+                if matchStart:
+                    parts.append("\n\n")
+
+                position = matchEnd
+
+            parts.append(self.text[position:])
+            self._withoutSections = "".join(parts)
+
+        return self._withoutSections
\ No newline at end of file
@@ -16,6 +16,9 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
 
+from ._paginate import _Paginate
+from ._batch import _Batch
+
 from .searching import Searching
 from .artists import Artists
 from .albums import Albums
@@ -0,0 +1,49 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+from itertools import islice
+from typing import Union, Tuple, Dict, Iterable, Any, AsyncIterator
+
+class _Batch:
+    async def _batch(self, ids: Iterable[int], fetch: callable, concurrency: int = 10) -> AsyncIterator[Tuple[int, Any, Union[Exception, None]]]:
+        async def run(id: int) -> Tuple[int, Any, Union[Exception, None]]:
+            try:
+                return id, await fetch(id), None
+
+            except Exception as error:
+                return id, None, error
+
+        ids = iter(dict.fromkeys(ids))
+        tasks = {asyncio.ensure_future(run(id)) for id in islice(ids, max(concurrency, 1))}
+
+        try:
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                tasks.update(asyncio.ensure_future(run(id)) for id in islice(ids, len(done)))
+
+                for task in done:
+                    yield task.result()
+
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+    async def _collect(self, ids: Iterable[int], fetch: callable, concurrency: int = 10) -> Dict[int, Any]:
+        return {id: result if error is None else error async for id, result, error in self._batch(ids, fetch, concurrency)}
\ No newline at end of file
@@ -0,0 +1,95 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+from typing import Union, List, Any, AsyncIterator
+
+class _Paginate:
+    async def _paginate(self, fetchPage: callable, readAhead: int = 1) -> AsyncIterator[Any]:
+        tasks = dict()
+        page = 1
+
+        try:
+            while page is not None:
+                task = tasks.pop(page, None) or asyncio.ensure_future(fetchPage(page))
+                items, page = await task
+
+                if page is not None:
+                    for nextPage in range(page, page + max(readAhead, 0)):
+                        if nextPage not in tasks:
+                            tasks[nextPage] = asyncio.ensure_future(fetchPage(nextPage))
+
+                for item in self._pageItems(items):
+                    yield item
+
+        finally:
+            for task in tasks.values():
+                task.cancel()
+                task.add_done_callback(lambda task: task.cancelled() or task.exception())
+
+
+    async def _fetchAllPages(self, fetchPage: callable, concurrency: int = 4) -> Union[List[Any], Any, None]:
+        items, page = await fetchPage(1)
+        result = self._pageItems(items)
+
+        while page is not None:
+            window = range(page, page + max(concurrency, 1))
+            tasks = [asyncio.ensure_future(fetchPage(windowPage)) for windowPage in window]
+            try:
+                responses = await asyncio.gather(*tasks)
+
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+
+                raise
+
+            for items, nextPage in responses:
+                if not items:
+                    page = None
+                    break
+
+                result.extend(self._pageItems(items))
+
+                if nextPage is None:
+                    page = None
+                    break
+
+            else:
+                page = window[-1] + 1
+
+        if not result:
+            return
+
+        return result if len(result) != 1 else result[0]
+
+
+    @staticmethod
+    def _pageItems(items: Union[List[Any], Any, None]) -> List[Any]:
+        if items is None:
+            return list()
+
+        return items if isinstance(items, list) else [items]
+
+
+    @staticmethod
+    def _nextPage(response: dict, page: Union[int, None], items: Union[list, None]) -> Union[int, None]:
+        if "next_page" in response:
+            return response.get("next_page")
+
+        return (page or 1) + 1 if items else None
\ No newline at end of file
@@ -17,10 +17,12 @@
 #  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
 
 from .getAlbum import GetAlbum
+from .getAlbums import GetAlbums
 from .getAlbumTracks import GetAlbumTracks
 
 class Albums(
     GetAlbum,
+    GetAlbums,
     GetAlbumTracks,
 ):
     pass
\ No newline at end of file
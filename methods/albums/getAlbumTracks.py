@@ -17,7 +17,7 @@
 #  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
 
 import asyncio
-from typing import Union, List
+from typing import Union, List, Tuple, AsyncIterator
 
 from geniux.aio import asyncFunction
 from geniux.types import Track
@@ -26,6 +26,21 @@ from geniux.enums import Sort
 class GetAlbumTracks:
     @asyncFunction
     async def getAlbumTracks(self, id: int, perPage: int = None, page: int = None, sort: Sort = None) -> Union[List[Track], Track, None]:
+        tracks, _ = await self._getAlbumTracksPage(id, perPage, page, sort)
+
+        return tracks
+
+
+    @asyncFunction
+    async def getAllAlbumTracks(self, id: int, perPage: int = None, sort: Sort = None, concurrency: int = 4) -> Union[List[Track], Track, None]:
+        return await self._fetchAllPages(lambda page: self._getAlbumTracksPage(id, perPage, page, sort), concurrency)
+
+
+    def iterAlbumTracks(self, id: int, perPage: int = None, sort: Sort = None, readAhead: int = 1) -> AsyncIterator[Track]:
+        return self._paginate(lambda page: self._getAlbumTracksPage(id, perPage, page, sort), readAhead)
+
+
+    async def _getAlbumTracksPage(self, id: int, perPage: int = None, page: int = None, sort: Sort = None) -> Tuple[Union[List[Track], Track, None], Union[int, None]]:
         tracks = await self._req(
             f"albums/{id}/tracks",
             {
@@ -36,11 +51,16 @@ class GetAlbumTracks:
             },
         )
 
+        nextPage = self._nextPage(tracks, page, tracks.get("tracks"))
+
         tracks = tracks.get("tracks")
+        if not tracks:
+            return None, nextPage
+
         for idx, trackInfo in enumerate(tracks):
             track = trackInfo.get("song")
             track["number"] = trackInfo.get("number")
 
             tracks[idx] = track
 
-        return self._finalizeResponse(tracks, Track)
\ No newline at end of file
+        return self._finalizeResponse(tracks, Track), nextPage
\ No newline at end of file
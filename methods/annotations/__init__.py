@@ -17,8 +17,10 @@
 #  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
 
 from .getAnnotation import GetAnnotation
+from .getAnnotations import GetAnnotations
 
 class Annotations(
     GetAnnotation,
+    GetAnnotations,
 ):
     pass
\ No newline at end of file
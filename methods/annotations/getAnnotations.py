@@ -0,0 +1,41 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Union, Tuple, Dict, Iterable, AsyncIterator
+
+from geniux.aio import asyncFunction
+from geniux.errors import Error
+from geniux.types import Annotation
+from geniux.enums import TextFormat
+
+class GetAnnotations:
+    @asyncFunction
+    async def getAnnotations(self, ids: Iterable[int], textFormat: TextFormat = None, concurrency: int = 10) -> Dict[int, Union[Annotation, Error, None]]:
+        """
+        Получает аннотации по списку идентификаторов (повторы отбрасываются), выполняя не более `concurrency` запросов одновременно. Возвращает словарь {id: аннотация}; для идентификаторов, запрос по которым завершился ошибкой, значением будет объект ошибки.
+        """
+
+        return await self._collect(ids, lambda id: self.getAnnotation(id, textFormat), concurrency)
+
+
+    def iterAnnotations(self, ids: Iterable[int], textFormat: TextFormat = None, concurrency: int = 10) -> AsyncIterator[Tuple[int, Union[Annotation, None], Union[Exception, None]]]:
+        """
+        Асинхронно выдаёт кортежи (id, аннотация, ошибка) по мере завершения запросов.
+        """
+
+        return self._batch(ids, lambda id: self.getAnnotation(id, textFormat), concurrency)
\ No newline at end of file
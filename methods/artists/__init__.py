@@ -17,11 +17,13 @@
 #  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
 
 from .getArtist import GetArtist
+from .getArtists import GetArtists
 from .getArtistAlbums import GetArtistAlbums
 from .getArtistTracks import GetArtistTracks
 
 class Artists(
     GetArtist,
+    GetArtists,
     GetArtistAlbums,
     GetArtistTracks,
 ):
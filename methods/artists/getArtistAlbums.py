@@ -17,7 +17,7 @@
 #  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
 
 import asyncio
-from typing import Union, List
+from typing import Union, List, Tuple, AsyncIterator
 
 from geniux.aio import asyncFunction
 from geniux.types import Album
@@ -26,6 +26,21 @@ from geniux.enums import Sort
 class GetArtistAlbums:
     @asyncFunction
     async def getArtistAlbums(self, id: int, perPage: int = None, page: int = None, sort: Sort = None) -> Union[List[Album], Album, None]:
+        albums, _ = await self._getArtistAlbumsPage(id, perPage, page, sort)
+
+        return albums
+
+
+    @asyncFunction
+    async def getAllArtistAlbums(self, id: int, perPage: int = None, sort: Sort = None, concurrency: int = 4) -> Union[List[Album], Album, None]:
+        return await self._fetchAllPages(lambda page: self._getArtistAlbumsPage(id, perPage, page, sort), concurrency)
+
+
+    def iterArtistAlbums(self, id: int, perPage: int = None, sort: Sort = None, readAhead: int = 1) -> AsyncIterator[Album]:
+        return self._paginate(lambda page: self._getArtistAlbumsPage(id, perPage, page, sort), readAhead)
+
+
+    async def _getArtistAlbumsPage(self, id: int, perPage: int = None, page: int = None, sort: Sort = None) -> Tuple[Union[List[Album], Album, None], Union[int, None]]:
         albums = await self._req(
             f"artists/{id}/albums",
             {
@@ -36,8 +51,10 @@ class GetArtistAlbums:
             },
         )
 
+        nextPage = self._nextPage(albums, page, albums.get("albums"))
+
         albums = albums.get("albums")
         if not albums:
-            return
+            return None, nextPage
 
-        return self._finalizeResponse(albums, Album)
\ No newline at end of file
+        return self._finalizeResponse(albums, Album), nextPage
\ No newline at end of file
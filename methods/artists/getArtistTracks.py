@@ -17,7 +17,7 @@
 #  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
 
 import asyncio
-from typing import Union, List
+from typing import Union, List, Tuple, AsyncIterator
 
 from geniux.aio import asyncFunction
 from geniux.types import Track
@@ -26,6 +26,21 @@ from geniux.enums import Sort
 class GetArtistTracks:
     @asyncFunction
     async def getArtistTracks(self, id: int, perPage: int = None, page: int = None, sort: Sort = None) -> Union[List[Track], Track, None]:
+        tracks, _ = await self._getArtistTracksPage(id, perPage, page, sort)
+
+        return tracks
+
+
+    @asyncFunction
+    async def getAllArtistTracks(self, id: int, perPage: int = None, sort: Sort = None, concurrency: int = 4) -> Union[List[Track], Track, None]:
+        return await self._fetchAllPages(lambda page: self._getArtistTracksPage(id, perPage, page, sort), concurrency)
+
+
+    def iterArtistTracks(self, id: int, perPage: int = None, sort: Sort = None, readAhead: int = 1) -> AsyncIterator[Track]:
+        return self._paginate(lambda page: self._getArtistTracksPage(id, perPage, page, sort), readAhead)
+
+
+    async def _getArtistTracksPage(self, id: int, perPage: int = None, page: int = None, sort: Sort = None) -> Tuple[Union[List[Track], Track, None], Union[int, None]]:
         tracks = await self._req(
             f"artists/{id}/songs",
             {
@@ -36,8 +51,10 @@ class GetArtistTracks:
             },
         )
 
+        nextPage = self._nextPage(tracks, page, tracks.get("songs"))
+
         tracks = tracks.get("songs")
         if not tracks:
-            return
+            return None, nextPage
 
-        return self._finalizeResponse(tracks, Track)
\ No newline at end of file
+        return self._finalizeResponse(tracks, Track), nextPage
\ No newline at end of file
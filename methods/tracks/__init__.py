@@ -17,12 +17,16 @@
 #  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
 
 from .getTrack import GetTrack
+from .getTracks import GetTracks
 from .getLyrics import GetLyrics
+from .getLyricsMany import GetLyricsMany
 from .getTrackAnnotations import GetTrackAnnotations
 
 class Tracks(
     GetTrack,
+    GetTracks,
     GetLyrics,
+    GetLyricsMany,
     GetTrackAnnotations,
 ):
     pass
\ No newline at end of file
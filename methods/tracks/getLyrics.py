@@ -17,14 +17,17 @@
 #  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
 
 import asyncio
-import re
-from typing import Union
-from bs4 import BeautifulSoup
+from typing import Union, Tuple
+
+from httpx import Response
 
 from geniux.aio import asyncFunction
+from geniux.cache import Cache
 from geniux.config import Genius
-from geniux.utils import clean
+from geniux.enums import LyricsSource
+from geniux.lyricsParser import parseLyrics, LyricsRootScanner
 from geniux.types import Track, Lyrics
+from geniux.webClient import Client as WebClient
 
 class GetLyrics:
     @asyncFunction
@@ -35,97 +38,89 @@ class GetLyrics:
         elif all((trackId, track)):
             self._raiseError("needsTrackIdOrTrackParameterNotBoth")
 
-        url = f"{Genius}songs/{trackId}" if not track or not track.url else f"{track.url}?bagon=1"
-        headers = {
-            "User-Agent": "Mozilla/5.0 (X11; Linux x86_64; rv:126.0) Gecko/20100101 Firefox/126.0",
-        }
+        key = self._lyricsKey(track.id if track else trackId, removeSections, enhance)
+        cacheKey = key if self._cache is not None else None
+        fetch = lambda: self._singleFlight(key, lambda: self._fetchLyrics(trackId, removeSections, enhance, track, cacheKey))
 
-        response = await self._client.req(url, headers=headers, responseType="response")
-        if response.status_code == 301:
-            response = await self._client.req(f'{response.headers.get("Location")}?bagon=1', headers=headers, responseType="response")
+        lyrics = self._fromCache(cacheKey, fetch) if cacheKey else None
+        if lyrics is None:
+            lyrics = await fetch()
+            if lyrics is None:
+                return
 
-        if response.status_code == 302:
-            response = await self._proxyClient.req(url, headers=headers, responseType="response")
-            if response.status_code == 302:
-                self._raiseError("trackNotAvailableInYourCountry")
+        return self._finalizeResponse(
+            {
+                **lyrics,
+                "track": track,
+            },
+            Lyrics,
+        )
 
-        if response.status_code == 404:
+
+    async def _fetchLyrics(self, trackId: int = None, removeSections: bool = False, enhance: bool = True, track: Track = None, cacheKey: str = None) -> Union[dict, None]:
+        page = await self._downloadLyricsPage(trackId, track)
+        if page is None:
             return
 
-        text = re.sub(r"<br/>", "\n", response.text)
+        lyrics = parseLyrics(page, removeSections, enhance, self._lyricsParser, self._lyricsSource)
+        if lyrics is None:
+            return
 
-        soup = BeautifulSoup(text, "html.parser")
-        div = soup.find("div", class_=re.compile("^lyrics$|Lyrics__Root"))
-        if div is None:
-            return None
+        if cacheKey:
+            self._cache.set(cacheKey, lyrics, self._cache.getTTL("lyrics"))
 
-        lyricsContent = div.extract()
+        return lyrics
 
-        pattern = re.compile(r"^(Pyong|LyricsFooter|LyricsHeader)__Container")
-        for div in lyricsContent.find_all("div", class_=pattern):
-            div.decompose()
 
-        adClassesPattern = re.compile(r"(DfpAd__Container|SidebarAd__Container|SidebarAd__StickyContainer|RightSidebar__Container|InreadContainer__Container)")
-        for adBlock in lyricsContent.find_all(class_=adClassesPattern):
-            adBlock.replace_with(str())
+    async def _downloadLyricsPage(self, trackId: int = None, track: Track = None) -> Union[str, None]:
+        knownURL = track.url if track else self._trackURLs.get(trackId)
+        url = f"{knownURL}?bagon=1" if knownURL else f"{Genius}songs/{trackId}"
+        headers = {
+            "User-Agent": "Mozilla/5.0 (X11; Linux x86_64; rv:126.0) Gecko/20100101 Firefox/126.0",
+        }
+
+        response, page = await self._requestLyricsPage(self._client, url, headers)
+        if response.status_code == 301:
+            location = response.headers.get("Location")
+            self._rememberTrackURL(trackId, location)
+            response, page = await self._requestLyricsPage(self._client, f"{location}?bagon=1", headers)
 
-        for keyword in ["You might also like", "Embed"]:
-            for block in lyricsContent.find_all(string=re.compile(keyword)):
-                block.parent.replace_with(str())
+        if response.status_code == 302:
+            response, page = await self._requestLyricsPage(self._proxyClient, url, headers)
+            if response.status_code == 302:
+                self._raiseError("trackNotAvailableInYourCountry")
 
-        pattern = re.compile(r"^Lyrics__Container")
-        for container in lyricsContent.find_all("div", class_=pattern):
-            container.insert_before("\n")
-            container.unwrap()
+        if response.status_code == 404:
+            self._trackURLs.pop(trackId, None)
+            if knownURL and not track:
+                return await self._downloadLyricsPage(trackId)
 
-        lyricsContent = str(lyricsContent)
-        lyricsContent = lyricsContent.replace("  ", " ")
-        lyricsContent = re.sub(r'<a class="ReferentFragmentdesktop__ClickTarget.*?" href=".*?(/|.*?)"><span class="ReferentFragmentdesktop__Highlight.*?">(.*?)</span></a>', r"\2", lyricsContent, flags=re.DOTALL)
-        lyricsContent = re.sub(r'<span style=".*".*></span>', str(), lyricsContent)
-        lyricsContent = lyricsContent[lyricsContent.find(">") + 2:lyricsContent.rfind("</div>")]
+            return
 
-        lyricsHTML = clean(lyricsContent)
-        instrumental = '<div class="LyricsPlaceholder__Message-uen8er-2 gotKKY">This song is an instrumental</div>' in lyricsHTML
-        if not instrumental:
-            if enhance:
-                lyricsHTML = lyricsHTML.replace("\n\n\n", "\n\n")
+        return page
 
-                lines = lyricsHTML.split("\n")
-                if lines and len(lines) >= 2 and "текст песни" in lines[0].lower() and not lines[1].strip():
-                    for _ in range(2):
-                        lines.pop(0)
 
-                lyricsHTML = "\n".join(lines)
+    async def _requestLyricsPage(self, client: WebClient, url: str, headers: dict) -> Tuple[Response, Union[str, None]]:
+        if not self._streamLyrics or self._lyricsSource == LyricsSource.PreloadedState:
+            response = await client.req(url, headers=headers, responseType="response")
+            return response, response.text
 
-            if removeSections:
-                pattern = r"(?:\n\n|\A)\[[^\[\]\?]+\]\n"
-                lyricsHTML = re.sub(pattern, lambda match: "\n\n" if match.start() != 0 else str(), lyricsHTML)
+        response = await client.req(url, headers=headers, responseType="stream")
+        try:
+            if response.status_code != 200:
+                return response, None
 
-            lyricsMarkdown = re.sub(r"([_*~`#+|{}\\])", r"\\\1", lyricsHTML)
-            lyricsMarkdown = re.sub(r"<b>(.*?)</b>", r"**\1**", lyricsMarkdown, flags=re.DOTALL)
+            scanner = LyricsRootScanner()
+            async for chunk in response.aiter_text():
+                if scanner.feed(chunk):
+                    break
 
-            lyricsMarkdownV1 = re.sub(r"<i>(.*?)</i>", r"*\1*", lyricsMarkdown, flags=re.DOTALL)
-            lyricsMarkdownV2 = re.sub(r"<i>(.*?)</i>", r"__\1__", lyricsMarkdown, flags=re.DOTALL)
-            #lyricsMarkdownV1 = re.sub(r">", r"\\>", lyricsMarkdownV1)
-            #lyricsMarkdownV2 = re.sub(r">", r"\\>", lyricsMarkdownV2)
+            return response, scanner.result()
 
-            lyricsPlain = BeautifulSoup(lyricsHTML, "html.parser").get_text()
+        finally:
+            await response.aclose()
 
-        lyrics = self._finalizeResponse(
-            {
-                **(
-                    {
-                        "plain": lyricsPlain,
-                        "markdown": lyricsMarkdownV1,
-                        "markdownV2": lyricsMarkdownV2,
-                        "html": lyricsHTML,
-                    }
-                    if not instrumental else dict()
-                ),
-                "instrumental": instrumental,
-                "track": track,
-            },
-            Lyrics,
-        )
 
-        return lyrics
+    @staticmethod
+    def _lyricsKey(trackId: int, removeSections: bool, enhance: bool) -> str:
+        return Cache.makeKey(f"lyrics/{trackId}", {"removeSections": removeSections, "enhance": enhance})
@@ -0,0 +1,143 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Union, Tuple, Dict, Iterable, AsyncIterator
+
+from geniux.aio import asyncFunction
+from geniux.errors import Error
+from geniux.lyricsParser import parseLyricsPage, renderLyrics, lyricsFormats
+from geniux.types import Track, Lyrics
+
+class GetLyricsMany:
+    @asyncFunction
+    async def getLyricsMany(self, tracks: Iterable[Union[int, Track]], removeSections: bool = False, enhance: bool = True, concurrency: int = 10, executor: Executor = None, formats: Iterable[str] = lyricsFormats) -> Dict[int, Union[Lyrics, Error, None]]:
+        """
+        Получает тексты песен для списка треков (идентификаторов или объектов `Track`). Возвращает словарь {id: текст}; для треков, запрос по которым завершился ошибкой, значением будет объект ошибки. Подробнее см. `iterLyrics`.
+        """
+
+        return {id: lyrics if error is None else error async for id, lyrics, error in self.iterLyrics(tracks, removeSections, enhance, concurrency, executor, formats)}
+
+
+    async def iterLyrics(self, tracks: Iterable[Union[int, Track]], removeSections: bool = False, enhance: bool = True, concurrency: int = 10, executor: Executor = None, formats: Iterable[str] = lyricsFormats) -> AsyncIterator[Tuple[int, Union[Lyrics, None], Union[Exception, None]]]:
+        """
+        Асинхронно выдаёт кортежи (id, текст, ошибка) по мере готовности. Страницы загружаются не более чем по `concurrency` одновременно, а разбираются в пуле процессов `executor` (по умолчанию — `ProcessPoolExecutor` на все ядра), поэтому разбор HTML не блокирует цикл событий и загрузку следующих страниц.
+
+        Форматы из `formats` (`plain`, `markdown`, `markdownV2`) вычисляются там же, в пуле, так что в цикле событий создаются только объекты `Lyrics`. Остальные форматы будут вычислены при первом обращении.
+        """
+
+        tracks = {(track.id if isinstance(track, Track) else track): track for track in tracks}
+        concurrency = max(concurrency, 1)
+        formats = tuple(textFormat for textFormat in formats if textFormat in lyricsFormats)
+
+        loop = asyncio.get_running_loop()
+        pages = asyncio.Queue(maxsize=concurrency)
+
+        async def download(id: int) -> Tuple[Union[str, dict, None], bool]:
+            track = tracks.get(id)
+            if self._cache is not None:
+                lyrics = self._cache.get(self._lyricsKey(id, removeSections, enhance))
+                if lyrics is not None:
+                    return lyrics, True
+
+            page = await self._downloadLyricsPage(None if isinstance(track, Track) else id, track if isinstance(track, Track) else None)
+            return page, False
+
+        async def produce() -> None:
+            async for id, result, error in self._batch(tracks, download, concurrency):
+                await pages.put((id, result, error))
+
+            await pages.put(None)
+
+        def isRendered(lyrics: dict) -> bool:
+            return "html" not in lyrics or all(textFormat in lyrics for textFormat in formats)
+
+        def finalize(id: int, lyrics: Union[dict, None]) -> Union[Lyrics, None]:
+            if lyrics is None:
+                return
+
+            track = tracks.get(id)
+            return self._finalizeResponse(
+                {
+                    **lyrics,
+                    "track": track if isinstance(track, Track) else None,
+                },
+                Lyrics,
+            )
+
+        ownExecutor = executor is None
+        if ownExecutor:
+            executor = ProcessPoolExecutor()
+
+        producer = asyncio.ensure_future(produce())
+        getter = asyncio.ensure_future(pages.get())
+        parsing = dict()
+
+        try:
+            while getter or parsing:
+                done, _ = await asyncio.wait([*parsing, getter] if getter else list(parsing), return_when=asyncio.FIRST_COMPLETED)
+
+                if getter in done:
+                    item = getter.result()
+                    getter = None
+
+                    if item is not None:
+                        id, result, error = item
+                        if error is not None:
+                            yield id, None, error
+
+                        elif result[0] is None or (result[1] and isRendered(result[0])):
+                            yield id, finalize(id, result[0]), None
+
+                        elif result[1]:
+                            parsing[loop.run_in_executor(executor, renderLyrics, result[0], formats)] = id, True
+
+                        else:
+                            parsing[loop.run_in_executor(executor, parseLyricsPage, result[0], removeSections, enhance, self._lyricsParser, self._lyricsSource, formats)] = id, False
+
+                        getter = False
+
+                for future in done & parsing.keys():
+                    id, cached = parsing.pop(future)
+
+                    try:
+                        lyrics = future.result()
+
+                    except Exception as error:
+                        yield id, None, error
+                        continue
+
+                    if lyrics is not None and not cached and self._cache is not None:
+                        self._cache.set(self._lyricsKey(id, removeSections, enhance), lyrics, self._cache.getTTL("lyrics"))
+
+                    yield id, finalize(id, lyrics), None
+
+                if getter is False and len(parsing) < concurrency:
+                    getter = asyncio.ensure_future(pages.get())
+
+        finally:
+            producer.cancel()
+            if getter:
+                getter.cancel()
+
+            for future in parsing:
+                future.cancel()
+
+            if ownExecutor:
+                executor.shutdown(wait=False)
\ No newline at end of file
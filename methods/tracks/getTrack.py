@@ -26,25 +26,30 @@ from geniux.enums import TextFormat
 class GetTrack:
     @asyncFunction
     async def getTrack(self, id: int, textFormat: TextFormat = None, includeLyrics: bool = False) -> Union[Track, None]:
-        tasks = [self._req(
+        request = self._req(
             f"songs/{id}",
             {
                 "text_format": textFormat.value,
             }
             if textFormat else None,
-        )]
+        )
 
-        if includeLyrics:
-            tasks.append(self.getLyrics(id))
+        if includeLyrics and id in self._trackURLs:
+            track, lyrics = await asyncio.gather(request, self.getLyrics(id))
 
-        responses = await asyncio.gather(*tasks)
+        else:
+            track = await request
+            lyrics = None
 
-        track = responses[0]
         track = track.get("song")
         if not track:
             return
 
         if includeLyrics:
-            track["lyrics"] = responses[1]
+            if id not in self._trackURLs:
+                self._rememberTrackURL(id, track.get("url"))
+                lyrics = await self.getLyrics(id)
+
+            track["lyrics"] = lyrics
 
         return self._finalizeResponse(track, Track)
\ No newline at end of file
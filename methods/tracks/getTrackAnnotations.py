@@ -16,7 +16,7 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Union, List
+from typing import Union, List, Tuple, AsyncIterator
 
 from geniux.aio import asyncFunction
 from geniux.types import Annotation
@@ -25,6 +25,21 @@ from geniux.enums import TextFormat
 class GetTrackAnnotations:
     @asyncFunction
     async def getTrackAnnotations(self, id: int, perPage: int = None, page: int = None, textFormat: TextFormat = None) -> Union[List[Annotation], Annotation, None]:
+        annotations, _ = await self._getTrackAnnotationsPage(id, perPage, page, textFormat)
+
+        return annotations
+
+
+    @asyncFunction
+    async def getAllTrackAnnotations(self, id: int, perPage: int = None, textFormat: TextFormat = None, concurrency: int = 4) -> Union[List[Annotation], Annotation, None]:
+        return await self._fetchAllPages(lambda page: self._getTrackAnnotationsPage(id, perPage, page, textFormat), concurrency)
+
+
+    def iterTrackAnnotations(self, id: int, perPage: int = None, textFormat: TextFormat = None, readAhead: int = 1) -> AsyncIterator[Annotation]:
+        return self._paginate(lambda page: self._getTrackAnnotationsPage(id, perPage, page, textFormat), readAhead)
+
+
+    async def _getTrackAnnotationsPage(self, id: int, perPage: int = None, page: int = None, textFormat: TextFormat = None) -> Tuple[Union[List[Annotation], Annotation, None], Union[int, None]]:
         annotations = await self._req(
             f"referents",
             {
@@ -36,8 +51,10 @@ class GetTrackAnnotations:
             },
         )
 
+        nextPage = self._nextPage(annotations, page, annotations.get("referents"))
+
         annotations = annotations.get("referents")
         if not annotations:
-            return
+            return None, nextPage
 
-        return self._finalizeResponse(annotations, Annotation)
\ No newline at end of file
+        return self._finalizeResponse(annotations, Annotation), nextPage
\ No newline at end of file
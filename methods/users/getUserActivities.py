@@ -17,7 +17,7 @@
 #  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
 
 import asyncio
-from typing import Union, List
+from typing import Union, List, Tuple, AsyncIterator
 
 from geniux.aio import asyncFunction
 from geniux.types import Annotation, Track, Comment, Pyong, Question, Answer
@@ -26,6 +26,21 @@ from geniux.enums import Sort, TextFormat
 class GetUserActivities:
     @asyncFunction
     async def getUserActivities(self, id: int, perPage: int = None, page: int = None, sort: Sort = None, textFormat: TextFormat = None) -> Union[List[Union[Annotation, Track, Question, Answer, Comment, Pyong]], Annotation, Track, Question, Answer, Comment, Pyong, None]:
+        activities, _ = await self._getUserActivitiesPage(id, perPage, page, sort, textFormat)
+
+        return activities
+
+
+    @asyncFunction
+    async def getAllUserActivities(self, id: int, perPage: int = None, sort: Sort = None, textFormat: TextFormat = None, concurrency: int = 4) -> Union[List[Union[Annotation, Track, Question, Answer, Comment, Pyong]], Annotation, Track, Question, Answer, Comment, Pyong, None]:
+        return await self._fetchAllPages(lambda page: self._getUserActivitiesPage(id, perPage, page, sort, textFormat), concurrency)
+
+
+    def iterUserActivities(self, id: int, perPage: int = None, sort: Sort = None, textFormat: TextFormat = None, readAhead: int = 1) -> AsyncIterator[Union[Annotation, Track, Question, Answer, Comment, Pyong]]:
+        return self._paginate(lambda page: self._getUserActivitiesPage(id, perPage, page, sort, textFormat), readAhead)
+
+
+    async def _getUserActivitiesPage(self, id: int, perPage: int = None, page: int = None, sort: Sort = None, textFormat: TextFormat = None) -> Tuple[Union[List[Union[Annotation, Track, Question, Answer, Comment, Pyong]], Annotation, Track, Question, Answer, Comment, Pyong, None], Union[int, None]]:
         activities = await self._req(
             f"users/{id}/contributions",
             {
@@ -38,9 +53,11 @@ class GetUserActivities:
             },
         )
 
+        nextPage = self._nextPage(activities, page, activities.get("contribution_groups"))
+
         activities = activities.get("contribution_groups")
         if not activities:
-            return
+            return None, nextPage
 
         for idx, activityInfo in enumerate(activities):
             activity = activityInfo.get("contributions")
@@ -59,4 +76,4 @@ class GetUserActivities:
 
             activities[idx] = self._finalizeResponse(activity, activityType)
 
-        return activities if len(activities) != 1 else activities[0]
\ No newline at end of file
+        return activities if len(activities) != 1 else activities[0], nextPage
\ No newline at end of file
@@ -17,7 +17,7 @@
 #  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
 
 import asyncio
-from typing import Union, List
+from typing import Union, List, Tuple, AsyncIterator
 
 from geniux.aio import asyncFunction
 from geniux.types import Annotation
@@ -26,6 +26,21 @@ from geniux.enums import Sort, TextFormat
 class GetUserAnnotations:
     @asyncFunction
     async def getUserAnnotations(self, id: int, perPage: int = None, page: int = None, sort: Sort = None, textFormat: TextFormat = None) -> Union[List[Annotation], Annotation, None]:
+        annotations, _ = await self._getUserAnnotationsPage(id, perPage, page, sort, textFormat)
+
+        return annotations
+
+
+    @asyncFunction
+    async def getAllUserAnnotations(self, id: int, perPage: int = None, sort: Sort = None, textFormat: TextFormat = None, concurrency: int = 4) -> Union[List[Annotation], Annotation, None]:
+        return await self._fetchAllPages(lambda page: self._getUserAnnotationsPage(id, perPage, page, sort, textFormat), concurrency)
+
+
+    def iterUserAnnotations(self, id: int, perPage: int = None, sort: Sort = None, textFormat: TextFormat = None, readAhead: int = 1) -> AsyncIterator[Annotation]:
+        return self._paginate(lambda page: self._getUserAnnotationsPage(id, perPage, page, sort, textFormat), readAhead)
+
+
+    async def _getUserAnnotationsPage(self, id: int, perPage: int = None, page: int = None, sort: Sort = None, textFormat: TextFormat = None) -> Tuple[Union[List[Annotation], Annotation, None], Union[int, None]]:
         annotations = await self._req(
             f"users/{id}/contributions/annotations",
             {
@@ -38,9 +53,11 @@ class GetUserAnnotations:
             },
         )
 
+        nextPage = self._nextPage(annotations, page, annotations.get("contribution_groups"))
+
         annotations = annotations.get("contribution_groups")
         if not annotations:
-            return
+            return None, nextPage
 
         for idx, annotationInfo in enumerate(annotations):
             annotation = annotationInfo.get("contributions")
@@ -53,4 +70,4 @@ class GetUserAnnotations:
 
             annotations[idx] = annotation
 
-        return self._finalizeResponse(annotations, Annotation)
\ No newline at end of file
+        return self._finalizeResponse(annotations, Annotation), nextPage
\ No newline at end of file
@@ -17,7 +17,7 @@
 #  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
 
 import asyncio
-from typing import Union, List
+from typing import Union, List, Tuple, AsyncIterator
 
 from geniux.aio import asyncFunction
 from geniux.types import Comment
@@ -26,6 +26,21 @@ from geniux.enums import TextFormat
 class GetUserComments:
     @asyncFunction
     async def getUserComments(self, id: int, perPage: int = None, page: int = None, textFormat: TextFormat = None) -> Union[List[Comment], Comment, None]:
+        comments, _ = await self._getUserCommentsPage(id, perPage, page, textFormat)
+
+        return comments
+
+
+    @asyncFunction
+    async def getAllUserComments(self, id: int, perPage: int = None, textFormat: TextFormat = None, concurrency: int = 4) -> Union[List[Comment], Comment, None]:
+        return await self._fetchAllPages(lambda page: self._getUserCommentsPage(id, perPage, page, textFormat), concurrency)
+
+
+    def iterUserComments(self, id: int, perPage: int = None, textFormat: TextFormat = None, readAhead: int = 1) -> AsyncIterator[Comment]:
+        return self._paginate(lambda page: self._getUserCommentsPage(id, perPage, page, textFormat), readAhead)
+
+
+    async def _getUserCommentsPage(self, id: int, perPage: int = None, page: int = None, textFormat: TextFormat = None) -> Tuple[Union[List[Comment], Comment, None], Union[int, None]]:
         comments = await self._req(
             f"users/{id}/contributions/comments",
             {
@@ -36,9 +51,11 @@ class GetUserComments:
             },
         )
 
+        nextPage = self._nextPage(comments, page, comments.get("contribution_groups"))
+
         comments = comments.get("contribution_groups")
         if not comments:
-            return
+            return None, nextPage
 
         for idx, commentInfo in enumerate(comments):
             comment = commentInfo.get("contributions")
@@ -51,4 +68,4 @@ class GetUserComments:
 
             comments[idx] = comment
 
-        return self._finalizeResponse(comments, Comment)
\ No newline at end of file
+        return self._finalizeResponse(comments, Comment), nextPage
\ No newline at end of file
@@ -17,7 +17,7 @@
 #  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
 
 import asyncio
-from typing import Union, List
+from typing import Union, List, Tuple, AsyncIterator
 
 from geniux.aio import asyncFunction
 from geniux.types import Pyong
@@ -26,6 +26,21 @@ from geniux.enums import TextFormat
 class GetUserPyongs:
     @asyncFunction
     async def getUserPyongs(self, id: int, perPage: int = None, page: int = None, textFormat: TextFormat = None) -> Union[List[Pyong], Pyong, None]:
+        pyongs, _ = await self._getUserPyongsPage(id, perPage, page, textFormat)
+
+        return pyongs
+
+
+    @asyncFunction
+    async def getAllUserPyongs(self, id: int, perPage: int = None, textFormat: TextFormat = None, concurrency: int = 4) -> Union[List[Pyong], Pyong, None]:
+        return await self._fetchAllPages(lambda page: self._getUserPyongsPage(id, perPage, page, textFormat), concurrency)
+
+
+    def iterUserPyongs(self, id: int, perPage: int = None, textFormat: TextFormat = None, readAhead: int = 1) -> AsyncIterator[Pyong]:
+        return self._paginate(lambda page: self._getUserPyongsPage(id, perPage, page, textFormat), readAhead)
+
+
+    async def _getUserPyongsPage(self, id: int, perPage: int = None, page: int = None, textFormat: TextFormat = None) -> Tuple[Union[List[Pyong], Pyong, None], Union[int, None]]:
         pyongs = await self._req(
             f"users/{id}/contributions/pyongs",
             {
@@ -36,9 +51,11 @@ class GetUserPyongs:
             },
         )
 
+        nextPage = self._nextPage(pyongs, page, pyongs.get("contribution_groups"))
+
         pyongs = pyongs.get("contribution_groups")
         if not pyongs:
-            return
+            return None, nextPage
 
         for idx, pyongInfo in enumerate(pyongs):
             pyong = pyongInfo.get("contributions")
@@ -51,4 +68,4 @@ class GetUserPyongs:
 
             pyongs[idx] = pyong
 
-        return self._finalizeResponse(pyongs, Pyong)
\ No newline at end of file
+        return self._finalizeResponse(pyongs, Pyong), nextPage
\ No newline at end of file
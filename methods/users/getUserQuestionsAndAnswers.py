@@ -17,7 +17,7 @@
 #  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
 
 import asyncio
-from typing import Union, List
+from typing import Union, List, Tuple, AsyncIterator
 
 from geniux.aio import asyncFunction
 from geniux.types import Question, Answer
@@ -26,6 +26,21 @@ from geniux.enums import TextFormat
 class GetUserQuestionsAndAnswers:
     @asyncFunction
     async def getUserQuestionsAndAnswers(self, id: int, perPage: int = None, page: int = None, textFormat: TextFormat = None) -> Union[List[Union[Question, Answer]], Question, Answer, None]:
+        questionsAndAnswers, _ = await self._getUserQuestionsAndAnswersPage(id, perPage, page, textFormat)
+
+        return questionsAndAnswers
+
+
+    @asyncFunction
+    async def getAllUserQuestionsAndAnswers(self, id: int, perPage: int = None, textFormat: TextFormat = None, concurrency: int = 4) -> Union[List[Union[Question, Answer]], Question, Answer, None]:
+        return await self._fetchAllPages(lambda page: self._getUserQuestionsAndAnswersPage(id, perPage, page, textFormat), concurrency)
+
+
+    def iterUserQuestionsAndAnswers(self, id: int, perPage: int = None, textFormat: TextFormat = None, readAhead: int = 1) -> AsyncIterator[Union[Question, Answer]]:
+        return self._paginate(lambda page: self._getUserQuestionsAndAnswersPage(id, perPage, page, textFormat), readAhead)
+
+
+    async def _getUserQuestionsAndAnswersPage(self, id: int, perPage: int = None, page: int = None, textFormat: TextFormat = None) -> Tuple[Union[List[Union[Question, Answer]], Question, Answer, None], Union[int, None]]:
         questionsAndAnswers = await self._req(
             f"users/{id}/contributions/questions_and_answers",
             {
@@ -36,9 +51,11 @@ class GetUserQuestionsAndAnswers:
             },
         )
 
+        nextPage = self._nextPage(questionsAndAnswers, page, questionsAndAnswers.get("contribution_groups"))
+
         questionsAndAnswers = questionsAndAnswers.get("contribution_groups")
         if not questionsAndAnswers:
-            return
+            return None, nextPage
 
         for idx, QAInfo in enumerate(questionsAndAnswers):
             QA = QAInfo.get("contributions")
@@ -51,4 +68,4 @@ class GetUserQuestionsAndAnswers:
 
             questionsAndAnswers[idx] = self._finalizeResponse(QA, Question if QAInfo.get("contribution_type") == "question" else Answer)
 
-        return questionsAndAnswers if len(questionsAndAnswers) != 1 else questionsAndAnswers[0]
\ No newline at end of file
+        return questionsAndAnswers if len(questionsAndAnswers) != 1 else questionsAndAnswers[0], nextPage
\ No newline at end of file
@@ -17,7 +17,7 @@
 #  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
 
 import asyncio
-from typing import Union, List
+from typing import Union, List, Tuple, AsyncIterator
 
 from geniux.aio import asyncFunction
 from geniux.types import Track
@@ -26,6 +26,21 @@ from geniux.enums import Sort
 class GetUserTranscribes:
     @asyncFunction
     async def getUserTranscribes(self, id: int, perPage: int = None, page: int = None, sort: Sort = None) -> Union[List[Track], Track, None]:
+        tracks, _ = await self._getUserTranscribesPage(id, perPage, page, sort)
+
+        return tracks
+
+
+    @asyncFunction
+    async def getAllUserTranscribes(self, id: int, perPage: int = None, sort: Sort = None, concurrency: int = 4) -> Union[List[Track], Track, None]:
+        return await self._fetchAllPages(lambda page: self._getUserTranscribesPage(id, perPage, page, sort), concurrency)
+
+
+    def iterUserTranscribes(self, id: int, perPage: int = None, sort: Sort = None, readAhead: int = 1) -> AsyncIterator[Track]:
+        return self._paginate(lambda page: self._getUserTranscribesPage(id, perPage, page, sort), readAhead)
+
+
+    async def _getUserTranscribesPage(self, id: int, perPage: int = None, page: int = None, sort: Sort = None) -> Tuple[Union[List[Track], Track, None], Union[int, None]]:
         tracks = await self._req(
             f"users/{id}/contributions/transcriptions",
             {
@@ -36,9 +51,11 @@ class GetUserTranscribes:
             },
         )
 
+        nextPage = self._nextPage(tracks, page, tracks.get("contribution_groups"))
+
         tracks = tracks.get("contribution_groups")
         if not tracks:
-            return
+            return None, nextPage
 
         for idx, trackInfo in enumerate(tracks):
             track = trackInfo.get("contributions")
@@ -53,4 +70,4 @@ class GetUserTranscribes:
 
             tracks[idx] = track
 
-        return self._finalizeResponse(tracks, Track)
\ No newline at end of file
+        return self._finalizeResponse(tracks, Track), nextPage
\ No newline at end of file
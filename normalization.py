@@ -0,0 +1,72 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+import re
+from functools import lru_cache
+from typing import Union
+
+from geniux.utils import clean
+
+memoSize = 65536
+
+cyrillicPattern = re.compile(r"[а-яёА-ЯЁ]")
+artistSuffixPattern = re.compile(r"\s*\((rus|ru|ukr|uk|prod|producer|0|1|2|3)\)", flags=re.IGNORECASE)
+
+@lru_cache(maxsize=memoSize)
+def normalizeTitle(title: Union[str, None]) -> Union[str, None]:
+    if not title:
+        return
+
+    start = title.find("(")
+    if start != -1 and cyrillicPattern.search(title, 0, start):
+        end = title.find(")")
+        if cyrillicPattern.search(title[start + 1:end]):
+            title = title[:end + 1]
+
+        else:
+            title = title[:title.rfind(" (")]
+
+    return clean(title)
+
+
+@lru_cache(maxsize=memoSize)
+def normalizeArtists(artists: Union[str, None]) -> Union[str, None]:
+    if not artists:
+        return
+
+    if " & " in artists:
+        artists = artists.split(" & ", 1)
+        artists = artists[0].split(", ") + [artists[1]]
+
+    else:
+        artists = [artists]
+
+    for idx, artist in enumerate(artists):
+        artist = artistSuffixPattern.sub(str(), artist)
+        start = artist.find("(")
+        if start != -1 and cyrillicPattern.search(artist, 0, start):
+            end = artist.find(")")
+            if cyrillicPattern.search(artist[start + 1:end]):
+                artist = artist[:end + 1]
+
+            else:
+                artist = artist[:artist.rfind(" (")]
+
+        artists[idx] = artist
+
+    return clean(", ".join(artists[:-1]) + " & " + artists[-1] if len(artists) > 1 else artists[0])
\ No newline at end of file
@@ -0,0 +1,145 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import threading
+from collections import deque
+from time import monotonic
+from typing import Union
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float = None) -> None:
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1)
+
+        self._tokens = self.capacity
+        self._updatedAt = monotonic()
+        self._lock = threading.Lock()
+
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updatedAt) * self.rate) - 1
+            self._updatedAt = now
+
+            return -self._tokens / self.rate if self._tokens < 0 else 0
+
+
+    async def acquire(self) -> None:
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+class AdaptiveConcurrency:
+    def __init__(self, maxLimit: int, minLimit: int = 1, decreaseFactor: float = .5) -> None:
+        self.maxLimit = maxLimit
+        self.minLimit = min(minLimit, maxLimit)
+        self.decreaseFactor = decreaseFactor
+
+        self.limit = float(maxLimit)
+        self.inFlight = 0
+
+        self._waiters = deque()
+        self._lock = threading.Lock()
+
+
+    async def acquire(self) -> None:
+        while True:
+            with self._lock:
+                if self.inFlight < int(self.limit):
+                    self.inFlight += 1
+                    return
+
+                waiter = asyncio.get_running_loop().create_future()
+                self._waiters.append(waiter)
+
+            try:
+                await waiter
+
+            except asyncio.CancelledError:
+                with self._lock:
+                    if waiter in self._waiters:
+                        self._waiters.remove(waiter)
+
+                self._wakeUp()
+                raise
+
+
+    def release(self, throttled: Union[bool, None] = None) -> None:
+        with self._lock:
+            self.inFlight -= 1
+
+            if throttled:
+                self.limit = max(self.minLimit, self.limit * self.decreaseFactor)
+
+            elif throttled is False:
+                self.limit = min(self.maxLimit, self.limit + 1 / self.limit)
+
+        self._wakeUp()
+
+
+    def _wakeUp(self) -> None:
+        with self._lock:
+            free = int(self.limit) - self.inFlight
+            waiters = [self._waiters.popleft() for _ in range(min(max(free, 0), len(self._waiters)))]
+
+        for waiter in waiters:
+            waiter.get_loop().call_soon_threadsafe(_setWaiterResult, waiter)
+
+
+def _setWaiterResult(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class RateLimiter:
+    """
+    Ограничитель частоты запросов: корзина токенов на каждый хост и адаптивный (AIMD) предел числа одновременных запросов, который уменьшается вдвое при ответах 429/5xx и плавно растёт при успешных ответах.
+    """
+
+    def __init__(self, rateLimit: float = None, maxConcurrency: int = None) -> None:
+        self.rateLimit = rateLimit
+        self.concurrency = AdaptiveConcurrency(maxConcurrency) if maxConcurrency else None
+
+        self._buckets = dict()
+
+
+    async def acquire(self, host: str) -> None:
+        if self.concurrency:
+            await self.concurrency.acquire()
+
+        if self.rateLimit:
+            bucket = self._buckets.get(host)
+            if not bucket:
+                bucket = self._buckets.setdefault(host, TokenBucket(self.rateLimit))
+
+            try:
+                await bucket.acquire()
+
+            except BaseException:
+                if self.concurrency:
+                    self.concurrency.release()
+
+                raise
+
+
+    def release(self, statusCode: Union[int, None]) -> None:
+        if self.concurrency:
+            self.concurrency.release((statusCode == 429 or statusCode >= 500) if statusCode else None)
\ No newline at end of file
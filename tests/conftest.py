@@ -0,0 +1,67 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from geniux import Client
+
+fixtures = Path(__file__).parent / "fixtures"
+song = json.loads((fixtures / "song.json").read_text())
+
+def handleRequest(request: httpx.Request) -> httpx.Response:
+    path = request.url.path
+    if path.startswith("/api/songs/"):
+        id = int(path.rsplit("/", 1)[1])
+        return httpx.Response(200, json={"response": {"song": {**song, "id": id, "url": f"https://genius.com/Artist-song-{id}-lyrics"}}})
+
+    if path.startswith("/songs/"):
+        return httpx.Response(301, headers={"Location": f"https://genius.com/Artist-song-{path.rsplit('/', 1)[1]}-lyrics"})
+
+    if path.endswith("-lyrics"):
+        return httpx.Response(200, text=(fixtures / "song.html").read_text())
+
+    return httpx.Response(404)
+
+
+@pytest.fixture
+def mockClient() -> callable:
+    clients = list()
+
+    def create(handler: callable = handleRequest, **options) -> Client:
+        client = Client(**options)
+        requests = client.requests = list()
+
+        def handle(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return handler(request)
+
+        for session, webClient in (("_session", client._client), ("_proxySession", client._proxyClient)):
+            setattr(client, session, httpx.AsyncClient(transport=httpx.MockTransport(handle)))
+            webClient.client = getattr(client, session)
+
+        clients.append(client)
+        return client
+
+    yield create
+
+    for client in clients:
+        client.close()
\ No newline at end of file
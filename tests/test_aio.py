@@ -0,0 +1,131 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import concurrent.futures
+import os
+import signal
+import threading
+from contextvars import ContextVar
+
+import pytest
+
+from geniux.aio import asyncFunction, getLoop
+
+variable = ContextVar("variable", default=None)
+timeout = 10
+
+class Service:
+    @asyncFunction
+    async def add(self, a: int, b: int) -> int:
+        await asyncio.sleep(0)
+        return a + b
+
+
+    @asyncFunction
+    async def fail(self) -> None:
+        raise ValueError("failed")
+
+
+    @asyncFunction
+    async def cancel(self) -> None:
+        raise asyncio.CancelledError()
+
+
+    @asyncFunction
+    async def read(self) -> any:
+        return variable.get(), threading.current_thread().name
+
+
+def runInThread(function: callable) -> any:
+    result = dict()
+
+    def target() -> None:
+        try:
+            result["value"] = function()
+
+        except BaseException as error:
+            result["error"] = error
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+
+    assert not thread.is_alive(), "sync call did not return"
+    if "error" in result:
+        raise result["error"]
+
+    return result["value"]
+
+
+def testResult() -> None:
+    assert Service().add(1, 2) == 3
+
+
+def testException() -> None:
+    with pytest.raises(ValueError):
+        Service().fail()
+
+
+def testCancelledCoroutine() -> None:
+    with pytest.raises((asyncio.CancelledError, concurrent.futures.CancelledError)):
+        runInThread(Service().cancel)
+
+
+def testAsyncCallReturnsCoroutine() -> None:
+    async def main() -> int:
+        return await Service().add(2, 3)
+
+    assert asyncio.run(main()) == 5
+
+
+def testContextIsCarried() -> None:
+    token = variable.set("value")
+    try:
+        assert Service().read() == ("value", "geniux-loop")
+
+    finally:
+        variable.reset(token)
+
+
+def testCallFromSecondThread() -> None:
+    service = Service()
+    service.add(0, 0)
+    loop = getLoop()
+
+    assert runInThread(lambda: service.add(2, 2)) == 4
+    assert getLoop() is loop
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="os.fork is not available")
+def testCallAfterFork() -> None:
+    service = Service()
+    service.add(0, 0)
+
+    pid = os.fork()
+    if not pid:
+        signal.alarm(timeout)
+        try:
+            os._exit(0 if service.add(3, 4) == 7 else 1)
+
+        finally:
+            os._exit(2)
+
+    _, status = os.waitpid(pid, 0)
+
+    assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
\ No newline at end of file
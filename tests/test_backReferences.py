@@ -0,0 +1,82 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+import gc
+import json
+import weakref
+from pathlib import Path
+
+from geniux.types import Track, Album, Lyrics
+
+song = json.loads((Path(__file__).parent / "fixtures" / "song.json").read_text())
+album = {
+    **song["album"],
+    "cover_arts": [
+        {"id": 1, "image_url": "https://images.genius.com/cover-1.1000x1000x1.jpg"},
+        {"id": 2, "image_url": "https://images.genius.com/cover-2.1000x1000x1.jpg"},
+    ],
+}
+
+def testLyricsPointAtTheirTrack(mockClient) -> None:
+    track = mockClient()._finalizeResponse(song, Track)
+
+    assert track.lyrics.track is track
+    assert "lyrics" not in track.lyrics.toDict()["track"]
+    assert json.loads(repr(track))["lyrics"]["track"]["id"] == song["id"]
+
+
+def testCoverArtsPointAtTheirAlbum(mockClient) -> None:
+    result = mockClient()._finalizeResponse(album, Album)
+
+    assert result.coverArts
+    for coverArt in result.coverArts:
+        assert coverArt.album is result
+        assert "coverArts" not in coverArt.toDict()["album"]
+
+
+def testGetLyricsLeavesTheTrackUntouched(mockClient) -> None:
+    client = mockClient()
+    track = client._finalizeResponse({**song, "url": "https://genius.com/Artist-song-1-lyrics"}, Track)
+    before = track.lyrics
+
+    lyrics = client.getLyrics(track=track)
+
+    assert isinstance(lyrics, Lyrics)
+    assert lyrics.track is track
+    assert track.lyrics is before
+
+
+def testBackReferencesDoNotKeepOwnersAlive(mockClient) -> None:
+    client = mockClient()
+    track = client._finalizeResponse(song, Track)
+    result = client._finalizeResponse(album, Album)
+    lyrics, coverArt = track.lyrics, result.coverArts[0]
+    owners = [weakref.ref(track), weakref.ref(result)]
+
+    gc.disable()
+    try:
+        del track, result
+        assert [owner() for owner in owners] == [None, None]
+
+    finally:
+        gc.enable()
+
+    assert lyrics.track is None
+    assert coverArt.album is None
+    assert "track" not in lyrics.toDict()
+    assert "album" not in json.loads(repr(coverArt))
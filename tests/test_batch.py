@@ -0,0 +1,90 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+
+import httpx
+
+from geniux.types import Track
+
+from conftest import handleRequest
+
+class Songs:
+    def __init__(self, failing: tuple = ()) -> None:
+        self.failing = failing
+        self.inFlight = 0
+        self.peak = 0
+
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.inFlight += 1
+        self.peak = max(self.peak, self.inFlight)
+
+        try:
+            await asyncio.sleep(.01)
+            if int(request.url.path.rsplit("/", 1)[1]) in self.failing:
+                raise RuntimeError(request.url.path)
+
+            return handleRequest(request)
+
+        finally:
+            self.inFlight -= 1
+
+
+def testDuplicateIdsAreFetchedOnce(mockClient) -> None:
+    client = mockClient()
+
+    tracks = client.getTracks([3, 1, 3, 2, 1, 3])
+
+    assert sorted(tracks) == [1, 2, 3]
+    assert {id: track.id for id, track in tracks.items()} == {3: 3, 1: 1, 2: 2}
+    assert sorted(request.url.path for request in client.requests) == ["/api/songs/1", "/api/songs/2", "/api/songs/3"]
+
+
+def testConcurrencyIsBounded(mockClient) -> None:
+    songs = Songs()
+    client = mockClient(songs)
+
+    tracks = client.getTracks(range(1, 21), concurrency=4)
+
+    assert len(tracks) == 20
+    assert songs.peak == 4
+    assert songs.inFlight == 0
+
+
+def testFailingIdLeavesTheRestIntact(mockClient) -> None:
+    client = mockClient(Songs(failing=(13,)))
+
+    tracks = client.getTracks(range(10, 17), concurrency=3)
+
+    assert isinstance(tracks[13], RuntimeError)
+    assert all(isinstance(tracks[id], Track) and tracks[id].id == id for id in tracks if id != 13)
+    assert len(tracks) == 7
+
+
+def testIteratorYieldsErrorsAsTheyHappen(mockClient) -> None:
+    client = mockClient(Songs(failing=(2,)))
+
+    async def main() -> list:
+        return [item async for item in client.iterTracks([1, 2, 3, 2], concurrency=2)]
+
+    results = {id: (track, error) for id, track, error in asyncio.run(main())}
+
+    assert sorted(results) == [1, 2, 3]
+    assert results[2][0] is None and isinstance(results[2][1], RuntimeError)
+    assert results[1][1] is None and results[1][0].id == 1
\ No newline at end of file
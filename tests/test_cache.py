@@ -0,0 +1,128 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import json
+from time import time
+
+import pytest
+
+from geniux.cache import Cache, MemoryCache, SQLiteCache, sqliteCache
+
+lyrics = {"html": "Текст песни " * 100}
+
+def payloadSize(value: dict) -> int:
+    return len(json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode())
+
+
+def testCacheIsAbstract() -> None:
+    with pytest.raises(TypeError):
+        Cache()
+
+
+def testMemoryCacheCountsBytes() -> None:
+    cache = MemoryCache()
+    cache.set("lyrics/1", lyrics)
+
+    assert cache.size == payloadSize(lyrics)
+    assert cache.get("lyrics/1") == lyrics
+
+
+def testMemoryCacheEnforcesMaxBytes() -> None:
+    size = payloadSize(lyrics)
+    cache = MemoryCache(maxBytes=size * 2 + size // 2)
+    for index in range(4):
+        cache.set(f"lyrics/{index}", lyrics)
+
+    assert len(cache) == 2
+    assert cache.size <= cache.maxBytes
+    assert cache.get("lyrics/0") is None
+    assert cache.get("lyrics/3") == lyrics
+
+
+def testMemoryCacheSkipsOversizedPayload() -> None:
+    cache = MemoryCache(maxBytes=payloadSize(lyrics) - 1)
+    cache.set("lyrics/1", lyrics)
+
+    assert len(cache) == 0
+
+
+def testSQLiteCacheCountsBytes(tmp_path) -> None:
+    cache = SQLiteCache(str(tmp_path / "geniux.db"))
+    cache.set("lyrics/1", lyrics)
+
+    assert cache._connection.execute("SELECT size FROM entries").fetchone()[0] == payloadSize(lyrics)
+    assert cache.get("lyrics/1") == lyrics
+
+    cache.close()
+
+
+def testSQLiteCacheEnforcesMaxBytes(tmp_path) -> None:
+    size = payloadSize(lyrics)
+    cache = SQLiteCache(str(tmp_path / "geniux.db"), maxBytes=size * 2 + size // 2)
+    cache.evictionInterval = 1
+    for index in range(4):
+        cache.set(f"lyrics/{index}", lyrics)
+
+    assert cache._connection.execute("SELECT SUM(size) FROM entries").fetchone()[0] <= cache.maxBytes
+    assert cache.get("lyrics/3") == lyrics
+
+    cache.close()
+
+
+def testSQLiteCacheTouchesEntriesOnlyAfterInterval(tmp_path, monkeypatch) -> None:
+    cache = SQLiteCache(str(tmp_path / "geniux.db"), ttl=3600)
+    monkeypatch.setattr(sqliteCache, "time", lambda: 1000)
+    cache.set("lyrics/1", lyrics)
+
+    for now, accessedAt in ((1000 + cache.touchInterval / 2, 1000), (1000 + cache.touchInterval, 1000 + cache.touchInterval)):
+        monkeypatch.setattr(sqliteCache, "time", lambda: now)
+        assert cache.get("lyrics/1") == lyrics
+        assert cache._connection.execute("SELECT accessedAt FROM entries").fetchone()[0] == accessedAt
+
+    cache.close()
+
+
+def testStaleEntriesAreRevalidatedInBackground(mockClient, tmp_path) -> None:
+    cache = SQLiteCache(str(tmp_path / "geniux.db"), staleTTL=600)
+    client = mockClient(cache=cache)
+
+    async def main() -> list:
+        for id in (1, 2):
+            await client.getTrack(id)
+        for id in (1, 2):
+            value = cache.get(f"songs/{id}")
+            cache.set(f"songs/{id}", {"song": {**value["song"], "title": "Stale"}})
+        cache._connection.execute("UPDATE entries SET expiresAt = ?", (time() - 1,))
+        requestsBefore = len(client.requests)
+
+        tracks = await asyncio.gather(*(client.getTrack(id) for id in (1, 2) for _ in range(3)))
+        await asyncio.gather(*client._revalidating.values())
+        assert sorted(request.url.path for request in client.requests[requestsBefore:]) == ["/api/songs/1", "/api/songs/2"]
+
+        return tracks
+
+    tracks = asyncio.run(main())
+
+    assert [track.title for track in tracks] == ["Stale"] * 6
+    assert len(client.requests) == 4
+    assert not client._revalidating
+    for id in (1, 2):
+        value, stale = cache.lookup(f"songs/{id}")
+        assert not stale
+        assert value["song"]["id"] == id and value["song"]["title"] != "Stale"
@@ -0,0 +1,74 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+import socket
+from time import perf_counter
+
+import httpx
+
+from geniux import Client, webClient
+
+constructions = 10
+
+def disableNetwork(monkeypatch) -> list:
+    calls = list()
+
+    def fail(*args, **kwargs) -> None:
+        calls.append(args)
+        raise OSError("network access is disabled in this test")
+
+    async def failAsync(*args, **kwargs) -> None:
+        fail(*args)
+
+    monkeypatch.setattr(socket.socket, "connect", fail)
+    monkeypatch.setattr(socket.socket, "connect_ex", fail)
+    monkeypatch.setattr(socket, "getaddrinfo", fail)
+    monkeypatch.setattr(socket, "create_connection", fail)
+    monkeypatch.setattr(httpx.AsyncHTTPTransport, "handle_async_request", failAsync)
+    monkeypatch.setattr(httpx.HTTPTransport, "handle_request", fail)
+
+    return calls
+
+
+def testConstructorDoesNoNetworkIO(monkeypatch) -> None:
+    calls = disableNetwork(monkeypatch)
+
+    elapsed = 0
+    for _ in range(constructions):
+        started = perf_counter()
+        client = Client()
+        elapsed += (perf_counter() - started) / constructions
+
+        client.close()
+
+    assert not calls
+    print(f"Client(): {elapsed * 1000:.2f} ms")
+
+
+def testNetworkIsReallyDisabled(monkeypatch) -> None:
+    calls = disableNetwork(monkeypatch)
+    monkeypatch.setattr(webClient, "retries", 1)
+
+    with Client() as client:
+        try:
+            client.checkUpdates()
+
+        except Exception:
+            pass
+
+    assert calls
\ No newline at end of file
@@ -0,0 +1,65 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+from concurrent.futures import ThreadPoolExecutor
+
+from geniux.cache import MemoryCache
+from geniux.lyricsParser import toPlain, toMarkdown
+
+trackIds = list(range(1, 6))
+
+def testFormatsAreRenderedInTheExecutor(mockClient) -> None:
+    client = mockClient()
+    lyrics = client.getLyricsMany(trackIds)
+
+    assert sorted(lyrics) == trackIds
+    for item in lyrics.values():
+        assert item._plain == toPlain(item.html)
+        assert item._markdown == toMarkdown(item.html)
+        assert item._markdownV2 == toMarkdown(item.html, v2=True)
+
+
+def testOnlyRequestedFormatsAreRendered(mockClient) -> None:
+    client = mockClient()
+    lyrics = client.getLyricsMany(trackIds, executor=ThreadPoolExecutor(2), formats=("plain",))
+
+    for item in lyrics.values():
+        assert item._plain is not None
+        assert item._markdown is None
+        assert item._markdownV2 is None
+
+
+def testCachedLyricsAreRenderedInTheExecutor(mockClient) -> None:
+    client = mockClient(cache=MemoryCache())
+    single = client.getLyrics(1)
+
+    calls = list()
+    executor = ThreadPoolExecutor(2)
+    submit = executor.submit
+    executor.submit = lambda function, *args: calls.append(function.__name__) or submit(function, *args)
+
+    lyrics = client.getLyricsMany(trackIds, executor=executor)
+
+    assert sorted(calls) == ["parseLyricsPage"] * 4 + ["renderLyrics"]
+    assert lyrics[1].plain == single.plain
+    assert lyrics[1]._markdown is not None
+
+    calls.clear()
+    client.getLyricsMany(trackIds, executor=executor)
+
+    assert calls == ["renderLyrics"]
\ No newline at end of file
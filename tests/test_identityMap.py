@@ -0,0 +1,80 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+import gc
+import json
+from pathlib import Path
+
+from geniux.types import Track, Artist
+
+song = json.loads((Path(__file__).parent / "fixtures" / "song.json").read_text())
+artist = song["primary_artist"]
+
+def testSameArtistAcrossTracksIsOneObject(mockClient) -> None:
+    client = mockClient(identityMap=True)
+    first, second = client._finalizeResponse([song, {**song, "id": song["id"] + 1}], Track)
+
+    assert first is not second
+    assert first.primaryArtist is second.primaryArtist
+    assert first.writers[0] is first.primaryArtist
+
+
+def testRicherPayloadIsMergedIn(mockClient) -> None:
+    client = mockClient(identityMap=True)
+    short = client._finalizeResponse({key: artist[key] for key in ("id", "name", "slug", "iq")}, Artist)
+
+    sameSize = client._finalizeResponse({**{key: artist[key] for key in ("id", "name", "slug")}, "instagram_name": "scriptonite"}, Artist)
+    assert sameSize is short
+    assert short.instagram == "scriptonite"
+    assert short.stats.IQ == artist["iq"]
+
+    full = client._finalizeResponse({**artist, "followers_count": 10, "description": {"plain": "Описание"}}, Artist)
+    assert full is short
+    assert short.description == "Описание"
+    assert short.stats.followers == 10
+    assert short.stats.IQ == artist["iq"]
+    assert short.verified and short.instagram == "scriptonite"
+
+    assert client._finalizeResponse({"id": artist["id"], "name": "Другое имя"}, Artist) is short
+    assert short.nickname != "Другое имя"
+
+
+def testContextualPayloadsStaySeparate(mockClient) -> None:
+    client = mockClient(identityMap=True)
+    shared = client._finalizeResponse(artist, Artist)
+
+    for contextKey in ("role", "annotationImpact"):
+        contextual = client._finalizeResponse({**artist, contextKey: "value"}, Artist)
+        assert contextual is not shared
+        assert contextual is not client._finalizeResponse({**artist, contextKey: "value"}, Artist)
+
+    assert shared.role is None
+    assert client._finalizeResponse(artist, Artist) is shared
+
+
+def testEntriesDisappearWithoutReferences(mockClient) -> None:
+    client = mockClient(identityMap=True)
+    track = client._finalizeResponse(song, Track)
+    primaryArtistId = track.primaryArtist.id
+
+    assert (Artist, primaryArtistId) in client._identities
+    del track
+    gc.collect()
+
+    assert len(client._identities) == 0
+    assert client._finalizeResponse(artist, Artist).id == primaryArtistId
\ No newline at end of file
@@ -0,0 +1,79 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+import json
+from pathlib import Path
+
+import pytest
+
+from geniux import Client
+from geniux.types import Track
+
+payload = (Path(__file__).parent / "fixtures" / "song.json").read_text()
+
+@pytest.fixture
+def clients() -> dict:
+    clients = {
+        "eager": Client(keepRaw=False),
+        "lazy": Client(lazy=True, keepRaw=False),
+    }
+
+    yield clients
+
+    for client in clients.values():
+        client.close()
+
+
+def hasSource(track: Track) -> bool:
+    try:
+        object.__getattribute__(track, "_source")
+
+    except AttributeError:
+        return False
+
+    return True
+
+
+def testLazyTrackMatchesEagerTrack(clients: dict) -> None:
+    eager = clients["eager"]._finalizeResponse(json.loads(payload), Track)
+    lazy = clients["lazy"]._finalizeResponse(json.loads(payload), Track)
+
+    assert repr(lazy) == repr(eager)
+
+
+def testSourceIsReleasedOnceAllFieldsAreBuilt(clients: dict) -> None:
+    track = clients["lazy"]._finalizeResponse(json.loads(payload), Track)
+    fields = Track._lazyFields
+
+    assert hasSource(track)
+
+    for field in fields[:-1]:
+        getattr(track, field)
+
+    assert hasSource(track)
+
+    getattr(track, fields[-1])
+
+    assert not hasSource(track)
+    assert track.raw is None
+
+
+def testEagerTrackKeepsNoSource(clients: dict) -> None:
+    track = clients["eager"]._finalizeResponse(json.loads(payload), Track)
+
+    assert not hasSource(track)
\ No newline at end of file
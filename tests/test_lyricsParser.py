@@ -0,0 +1,87 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+import re
+from importlib.util import find_spec
+from pathlib import Path
+
+import pytest
+
+from geniux.lyricsParser import parseLyrics, resolveParser, toPlain, toMarkdown
+
+fixtures = sorted((Path(__file__).parent / "fixtures").glob("*.html"))
+markupSamples = [
+    "<b>bold</b> and <i>italic</i>",
+    "<b><i>both</i></b> *star* _under_ {brace} back\\slash #tag ~wave~ `code` a+b|c",
+    "<i>open <i>nested</i> close</i> <b>open <b>nested</b> close</b>",
+    "<b>unclosed and <i>mixed</b> order</i>",
+    "<b>multi\nline</b>\n<i>multi\nline</i>",
+]
+options = [(removeSections, enhance) for removeSections in (False, True) for enhance in (False, True)]
+
+def render(lyrics: dict) -> dict:
+    html = lyrics.get("html")
+    return {
+        **lyrics,
+        "plain": toPlain(html) if html is not None else None,
+        "markdown": toMarkdown(html) if html is not None else None,
+        "markdownV2": toMarkdown(html, v2=True) if html is not None else None,
+    }
+
+
+@pytest.mark.parametrize("fixture", fixtures, ids=lambda fixture: fixture.stem)
+def testPageIsCleanedUp(fixture: Path) -> None:
+    lyrics = parseLyrics(fixture.read_text(), enhance=False)
+
+    html = lyrics["html"]
+    assert not lyrics["instrumental"]
+    assert "[" in html
+    for leftover in ("ReferentFragment", "Lyrics__Container", "SidebarAd", "You might also like", "Embed", "<br/>", "<span"):
+        assert leftover not in html
+
+
+@pytest.mark.parametrize("backend", ["lxml", "html5lib"])
+@pytest.mark.parametrize("fixture", fixtures, ids=lambda fixture: fixture.stem)
+def testBackendsProduceIdenticalOutput(fixture: Path, backend: str) -> None:
+    if not find_spec(backend):
+        pytest.skip(f"{backend} is not installed")
+
+    assert resolveParser(backend) == backend
+
+    page = fixture.read_text()
+    for removeSections, enhance in options:
+        assert render(parseLyrics(page, removeSections, enhance, backend)) == render(parseLyrics(page, removeSections, enhance, "html.parser"))
+
+
+def testUnknownBackendFallsBackToHTMLParser() -> None:
+    assert resolveParser("selectolax") == "html.parser"
+    assert resolveParser(None) == "html.parser"
+
+
+def referenceMarkdown(lyricsHTML: str, v2: bool = False) -> str:
+    lyricsMarkdown = re.sub(r"([_*~`#+|{}\\])", r"\\\1", lyricsHTML)
+    lyricsMarkdown = re.sub(r"<b>(.*?)</b>", r"**\1**", lyricsMarkdown, flags=re.DOTALL)
+
+    return re.sub(r"<i>(.*?)</i>", r"__\1__" if v2 else r"*\1*", lyricsMarkdown, flags=re.DOTALL)
+
+
+@pytest.mark.parametrize("v2", [False, True])
+def testMarkdownMatchesSeparatePasses(v2: bool) -> None:
+    samples = markupSamples + [parseLyrics(fixture.read_text())["html"] for fixture in fixtures]
+    for sample in samples:
+        assert toMarkdown(sample, v2) == referenceMarkdown(sample, v2)
\ No newline at end of file
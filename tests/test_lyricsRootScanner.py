@@ -0,0 +1,68 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+from pathlib import Path
+
+import pytest
+
+from geniux.lyricsParser import LyricsRootScanner, findLyricsRoot
+
+fixtures = sorted((Path(__file__).parent / "fixtures").glob("*.html"))
+chunkSizes = [1, 7, 64, 4096]
+
+def scan(page: str, chunkSize: int) -> tuple:
+    scanner = LyricsRootScanner()
+    resident = 0
+    for index in range(0, len(page), chunkSize):
+        if scanner.feed(page[index:index + chunkSize]):
+            break
+
+        if scanner.start is None:
+            resident = max(resident, len(scanner.text))
+
+    return scanner.result(), resident
+
+
+@pytest.mark.parametrize("chunkSize", chunkSizes)
+@pytest.mark.parametrize("fixture", fixtures, ids=lambda fixture: fixture.stem)
+def testStreamingFindsTheSameRoot(fixture: Path, chunkSize: int) -> None:
+    page = fixture.read_text()
+    start, end = findLyricsRoot(page)
+
+    assert scan(page, chunkSize)[0] == page[start:end]
+
+
+@pytest.mark.parametrize("chunkSize", chunkSizes)
+def testPrefixIsNotKeptInMemory(chunkSize: int) -> None:
+    page = (fixtures[0]).read_text()
+    index = page.find("<body>")
+    prefix = "<script>var state = '" + "<div class=\"Lyrics__Root\">" * 5000 + "';</script><!-- " + "x" * 100000 + " --><style>" + "a{}" * 30000 + "</style>"
+    page = page[:index] + prefix + page[index:]
+    start, end = findLyricsRoot(page)
+
+    result, resident = scan(page, chunkSize)
+
+    assert result == page[start:end]
+    assert resident <= chunkSize + LyricsRootScanner.tailSize + 256
+
+
+def testUnfinishedRootIsReturnedWhole() -> None:
+    page = fixtures[0].read_text()
+    start, end = findLyricsRoot(page)
+
+    assert scan(page[:end - 10], 64)[0] == page[start:end - 10]
\ No newline at end of file
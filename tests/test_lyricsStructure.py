@@ -0,0 +1,88 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+import re
+from pathlib import Path
+
+import pytest
+
+from geniux import Client
+from geniux.lyricsParser import parseLyrics, finishLyrics
+from geniux.lyricsStructure import LyricsStructure
+from geniux.types import Lyrics
+
+fixtures = sorted((Path(__file__).parent / "fixtures").glob("*.html"))
+lyricsHTML = "[Intro]\nyo\n\n[Verse 1: A &amp; B]\nline one\n<b>line</b> two\n[Laughs]\n\n[Chorus]\nla la\nla\n\n[Verse 2: A]\nend"
+
+def removeSections(text: str) -> str:
+    return re.sub(r"(?:\n\n|\A)\[[^\[\]\?]+\]\n", lambda match: "\n\n" if match.start() != 0 else str(), text)
+
+
+@pytest.fixture
+def client() -> Client:
+    client = Client()
+    yield client
+    client.close()
+
+
+def testSectionsAndLines(client: Client) -> None:
+    lyrics = client._finalizeResponse({"html": lyricsHTML}, Lyrics)
+    structure = lyrics.structure
+
+    assert [section.header for section in structure.sections] == ["Intro", "Verse 1: A & B", "Chorus", "Verse 2: A"]
+    assert [line.text for line in structure.section("Chorus")[0].lines] == ["la la", "la"]
+    assert structure.section("verse 1")[0].performer == "A & B"
+    assert [section.header for section in structure.section("Verse")] == ["Verse 1: A & B", "Verse 2: A"]
+    assert structure.getLines(2, 5) == "line two\n[Laughs]\nla la"
+
+    for line in structure.lines:
+        assert lyrics.plain[line.start:line.end] == line.text
+
+    assert lyrics.structure is structure
+    assert "structure" not in repr(lyrics)
+
+
+@pytest.mark.parametrize("header", ["[: Artist]", "[ ]"])
+def testHeaderWithoutName(client: Client, header: str) -> None:
+    lyrics = client._finalizeResponse({"html": f"{header}\nline\n\n[Chorus]\nla"}, Lyrics)
+    structure = lyrics.structure
+
+    assert structure.sections[0].name is None
+    assert structure.sections[0].lines[0].text == "line"
+    assert structure.section(header[1:-1]) == ([structure.sections[0]] if header[1:-1].strip() else [])
+    assert structure.section("chorus")[0].lines[0].text == "la"
+
+
+@pytest.mark.parametrize("text", [
+    "a\n\n[Outro]",
+    "a\n \n[Chorus]\nc",
+    "a\n\n [Chorus]\nc",
+    "\n\n[Intro]\n\n[Verse]\nx",
+    "[Intro]\n[Verse]\nx",
+    lyricsHTML,
+])
+def testWithoutSectionsMatchesRemoveSections(text: str) -> None:
+    assert LyricsStructure(text).withoutSections() == removeSections(text)
+    assert finishLyrics(text, False, True, False)["html"] == removeSections(text)
+
+
+@pytest.mark.parametrize("fixture", fixtures, ids=lambda fixture: fixture.stem)
+def testRemoveSectionsOnPages(fixture: Path) -> None:
+    page = fixture.read_text()
+    for enhance in (False, True):
+        assert parseLyrics(page, True, enhance)["html"] == removeSections(parseLyrics(page, False, enhance)["html"])
\ No newline at end of file
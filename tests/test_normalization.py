@@ -0,0 +1,41 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+import json
+from pathlib import Path
+
+import pytest
+
+from geniux.normalization import normalizeTitle, normalizeArtists
+
+corpus = json.loads((Path(__file__).parent / "fixtures" / "names.json").read_text())
+
+@pytest.mark.parametrize("title, expected", corpus["titles"].items())
+def testNormalizeTitle(title: str, expected: str) -> None:
+    assert normalizeTitle(title) == expected
+
+
+@pytest.mark.parametrize("artists, expected", corpus["artists"].items())
+def testNormalizeArtists(artists: str, expected: str) -> None:
+    assert normalizeArtists(artists) == expected
+
+
+@pytest.mark.parametrize("value", [None, str()])
+def testEmptyValues(value: str) -> None:
+    assert normalizeTitle(value) is None
+    assert normalizeArtists(value) is None
\ No newline at end of file
@@ -0,0 +1,168 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import json
+from pathlib import Path
+from time import monotonic
+
+import httpx
+import pytest
+
+album = json.loads((Path(__file__).parent / "fixtures" / "song.json").read_text())["album"]
+
+class Pages:
+    def __init__(self, pages: dict, delays: dict = None) -> None:
+        self.pages = pages
+        self.delays = delays or dict()
+        self.started = list()
+        self.finished = list()
+
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", 1))
+        self.started.append(page)
+
+        await asyncio.sleep(self.delays.get(page, 0))
+        response = self.pages.get(page, ([], None))
+        if isinstance(response, Exception):
+            raise response
+
+        self.finished.append(page)
+        ids, nextPage = response
+        return httpx.Response(200, json={"response": {"albums": [{**album, "id": id} for id in ids], "next_page": nextPage}})
+
+
+def ids(albums: list) -> list:
+    return [album.id for album in albums]
+
+
+def testPagesAreReturnedInOrder(mockClient) -> None:
+    pages = Pages({page: ([page * 10, page * 10 + 1], page + 1 if page < 6 else None) for page in range(1, 7)}, {page: (7 - page) / 100 for page in range(1, 7)})
+    client = mockClient(pages)
+
+    albums = client.getAllArtistAlbums(1, concurrency=3)
+
+    assert ids(albums) == [id for page in range(1, 7) for id in (page * 10, page * 10 + 1)]
+    assert sorted(pages.started) == list(range(1, 8))
+
+
+@pytest.mark.parametrize("stop", [([], 5), ([40, 41], None)], ids=["emptyPage", "noNextPage"])
+def testFetchingStopsAtTheLastPage(mockClient, stop: tuple) -> None:
+    pages = Pages({1: ([10], 2), 2: ([20], 3), 3: ([30], 4), 4: stop, **{page: ([page * 10], page + 1) for page in range(5, 12)}})
+    client = mockClient(pages)
+
+    albums = client.getAllArtistAlbums(1, concurrency=4)
+
+    assert ids(albums) == [10, 20, 30] + stop[0]
+    assert max(pages.started) == 5
+
+
+def testSinglePageWithOneItemReturnsTheObject(mockClient) -> None:
+    client = mockClient(Pages({1: ([10], None)}))
+
+    result = client.getAllArtistAlbums(1)
+
+    assert not isinstance(result, list)
+    assert result.id == 10
+    assert client.getAllArtistAlbums(2) is not None
+    assert mockClient(Pages({1: ([], None)})).getAllArtistAlbums(1) is None
+
+
+def testFailedPageCancelsTheOthers(mockClient) -> None:
+    pages = Pages({1: ([10], 2), 3: RuntimeError("page 3"), **{page: ([page * 10], page + 1) for page in (2, 4, 5)}}, {page: .5 for page in (2, 4, 5)})
+    client = mockClient(pages)
+
+    async def main() -> None:
+        started = monotonic()
+        with pytest.raises(RuntimeError, match="page 3"):
+            await client.getAllArtistAlbums(1, concurrency=4)
+
+        assert monotonic() - started < .4
+        await asyncio.sleep(.6)
+
+    asyncio.run(main())
+
+    assert sorted(pages.started) == [1, 2, 3, 4, 5]
+    assert pages.finished == [1]
+
+
+def testIteratorReadsAhead(mockClient) -> None:
+    pages = Pages({page: ([page * 10, page * 10 + 1], page + 1) for page in range(1, 10)})
+    client = mockClient(pages)
+
+    async def main() -> None:
+        iterator = client.iterArtistAlbums(1, readAhead=3)
+
+        assert (await iterator.__anext__()).id == 10
+        await asyncio.sleep(.05)
+        assert sorted(pages.started) == [1, 2, 3, 4]
+        assert sorted(pages.finished) == [1, 2, 3, 4]
+
+        assert (await iterator.__anext__()).id == 11
+        assert (await iterator.__anext__()).id == 20
+        await asyncio.sleep(.05)
+        assert sorted(pages.started) == [1, 2, 3, 4, 5]
+
+        await iterator.aclose()
+
+    asyncio.run(main())
+
+
+def testIteratorWithoutReadAheadFetchesOnDemand(mockClient) -> None:
+    pages = Pages({page: ([page * 10], page + 1) for page in range(1, 10)})
+    client = mockClient(pages)
+
+    async def main() -> None:
+        iterator = client.iterArtistAlbums(1, readAhead=0)
+        for page in (1, 2, 3):
+            assert (await iterator.__anext__()).id == page * 10
+            await asyncio.sleep(.02)
+            assert pages.started == list(range(1, page + 1))
+
+        await iterator.aclose()
+
+    asyncio.run(main())
+
+
+def testIteratorStopsAtTheLastPage(mockClient) -> None:
+    client = mockClient(Pages({1: ([10], 2), 2: ([20], None)}))
+
+    async def main() -> list:
+        return [album.id async for album in client.iterArtistAlbums(1, readAhead=4)]
+
+    assert asyncio.run(main()) == [10, 20]
+
+
+def testBreakingOutCancelsSpeculativePages(mockClient) -> None:
+    pages = Pages({page: ([page * 10], page + 1) for page in range(1, 10)}, {page: .3 for page in range(2, 10)})
+    client = mockClient(pages)
+
+    async def main() -> None:
+        iterator = client.iterArtistAlbums(1, readAhead=3)
+        async for album in iterator:
+            await asyncio.sleep(.05)
+            break
+
+        await iterator.aclose()
+        await asyncio.sleep(.4)
+
+    asyncio.run(main())
+
+    assert sorted(pages.started) == [1, 2, 3, 4]
+    assert pages.finished == [1]
\ No newline at end of file
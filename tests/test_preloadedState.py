@@ -0,0 +1,78 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+import re
+from pathlib import Path
+
+import pytest
+
+from geniux.enums import LyricsSource
+from geniux.lyricsParser import parseLyrics, parsePreloadedState, loadPreloadedState
+
+page = (Path(__file__).parent / "fixtures" / "preloadedState.html").read_text()
+options = [(removeSections, enhance) for removeSections in (False, True) for enhance in (False, True)]
+statePattern = re.compile(r"<script>window\.__PRELOADED_STATE__ = JSON\.parse\('.*?'\);</script>", re.S)
+
+def withState(literal: str) -> str:
+    return statePattern.sub(lambda _: f"<script>window.__PRELOADED_STATE__ = JSON.parse('{literal}');</script>", page)
+
+
+def testFixtureUsesEscapes() -> None:
+    literal = statePattern.search(page).group()
+    for escapeSequence in ("\\'", '\\"', "\\u0451", "\\ud83d\\udd25"):
+        assert escapeSequence in literal
+
+
+def testStateIsDecoded() -> None:
+    state = loadPreloadedState(page)
+
+    assert state["songPage"]["trackingData"][0]["value"] == "Artist's \"State\""
+    body = state["songPage"]["lyricsData"]["body"]["html"]
+    assert "ёлка" in body and "🔥" in body and "back\\slash" in body
+
+
+@pytest.mark.parametrize("removeSections, enhance", options)
+def testStateMatchesDOM(removeSections: bool, enhance: bool) -> None:
+    fromState = parsePreloadedState(page, removeSections, enhance)
+
+    assert fromState is not None
+    assert fromState == parseLyrics(page, removeSections, enhance)
+    assert fromState == parseLyrics(page, removeSections, enhance, source=LyricsSource.PreloadedState)
+
+
+@pytest.mark.parametrize("brokenPage", [
+    statePattern.sub(str(), page),
+    withState("{\\\"songPage\\\":"),
+    withState("{\\\"songPage\\\":{\\\"lyricsData\\\":{\\\"body\\\":{\\\"html\\\":\\\"\\\\xZZ\\\"}}}}"),
+    withState("{\\\"songPage\\\":{\\\"lyricsData\\\":{\\\"body\\\":{}}}}"),
+    withState("{\\\"songPage\\\":null}"),
+    withState("[]"),
+    withState("{\\'broken\\x\\'}"),
+    page[:page.rfind("');</script>")],
+], ids=["missing", "truncated", "badJSONEscape", "noBody", "noSongPage", "notObject", "badLiteral", "unterminated"])
+def testFallsBackToDOM(brokenPage: str) -> None:
+    assert parsePreloadedState(brokenPage) is None
+    for removeSections, enhance in options:
+        assert parseLyrics(brokenPage, removeSections, enhance, source=LyricsSource.PreloadedState) == parseLyrics(page, removeSections, enhance)
+
+
+def testInstrumentalState() -> None:
+    instrumentalPage = withState("{\\\"songPage\\\":{\\\"lyricsData\\\":{\\\"body\\\":{\\\"html\\\":\\\"\\\"},\\\"lyricsPlaceholderReason\\\":\\\"instrumental\\\"}}}")
+
+    lyrics = parseLyrics(instrumentalPage, source=LyricsSource.PreloadedState)
+    assert lyrics == {"instrumental": True}
\ No newline at end of file
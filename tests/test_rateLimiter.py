@@ -0,0 +1,130 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+from time import monotonic
+
+import pytest
+
+from geniux.rateLimiter import AdaptiveConcurrency, RateLimiter, TokenBucket
+
+def testInFlightNeverExceedsLimit() -> None:
+    concurrency = AdaptiveConcurrency(8)
+    outcomes = [True, None, False] * 20
+    peaks = list()
+
+    async def work(throttled: bool) -> None:
+        await concurrency.acquire()
+        assert concurrency.inFlight <= int(concurrency.limit)
+        peaks.append(concurrency.inFlight)
+
+        await asyncio.sleep(.001)
+        concurrency.release(throttled)
+
+    async def main() -> None:
+        await asyncio.gather(*(work(throttled) for throttled in outcomes))
+
+    asyncio.run(main())
+
+    assert max(peaks) == 8
+    assert concurrency.inFlight == 0
+    assert not concurrency._waiters
+
+
+def testLimitHalvesOnThrottlingAndGrowsOnSuccess() -> None:
+    limiter = RateLimiter(maxConcurrency=8)
+    concurrency = limiter.concurrency
+
+    for statusCode, expected in ((503, 4), (429, 2), (502, 1), (500, 1), (None, 1), (200, 2), (404, 2.5)):
+        concurrency.inFlight += 1
+        limiter.release(statusCode)
+        assert concurrency.limit == pytest.approx(expected)
+
+    for _ in range(100):
+        concurrency.inFlight += 1
+        limiter.release(200)
+
+    assert concurrency.limit == 8
+
+
+def testCancelledWaiterDoesNotLeakASlot() -> None:
+    concurrency = AdaptiveConcurrency(1)
+
+    async def main() -> None:
+        await concurrency.acquire()
+
+        cancelled = asyncio.ensure_future(concurrency.acquire())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.gather(cancelled, return_exceptions=True)
+        assert not concurrency._waiters
+
+        woken, waiting = asyncio.ensure_future(concurrency.acquire()), asyncio.ensure_future(concurrency.acquire())
+        await asyncio.sleep(0)
+
+        concurrency.release()
+        woken.cancel()
+        await asyncio.wait_for(waiting, 1)
+        assert woken.cancelled()
+        assert concurrency.inFlight == 1
+
+        concurrency.release()
+        await asyncio.wait_for(concurrency.acquire(), 1)
+        concurrency.release()
+
+    asyncio.run(main())
+
+    assert concurrency.inFlight == 0
+    assert not concurrency._waiters
+
+
+def testTokenBucketSpacesRequests() -> None:
+    bucket = TokenBucket(20, capacity=1)
+
+    async def main() -> list:
+        times = list()
+        for _ in range(6):
+            await bucket.acquire()
+            times.append(monotonic())
+
+        return times
+
+    times = asyncio.run(main())
+
+    for previous, current in zip(times, times[1:]):
+        assert current - previous >= 1 / 20 * .8
+    assert times[-1] - times[0] < 5 / 20 + .2
+
+
+def testRateLimitIsPerHost() -> None:
+    limiter = RateLimiter(rateLimit=50)
+
+    async def main() -> tuple:
+        started = monotonic()
+        for _ in range(60):
+            await limiter.acquire("genius.com")
+        limited = monotonic() - started
+
+        started = monotonic()
+        await limiter.acquire("images.genius.com")
+        return limited, monotonic() - started
+
+    limited, other = asyncio.run(main())
+
+    assert .15 < limited < .5
+    assert other < .05
\ No newline at end of file
@@ -0,0 +1,49 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+
+def testOverrideAppliesOnlyToItsClient(mockClient) -> None:
+    first, second = mockClient(), mockClient(keepRaw=False)
+
+    with first.rawPayloads(False):
+        assert first.getTrack(1).raw is None
+        assert second.getTrack(1).raw is None
+
+        with second.rawPayloads(True):
+            assert first.getTrack(2).raw is None
+            assert second.getTrack(2).raw["id"] == 2
+
+        assert second.getTrack(3).raw is None
+
+    assert first.getTrack(4).raw["id"] == 4
+    assert second.getTrack(4).raw is None
+
+
+def testOverrideAppliesToAsyncCalls(mockClient) -> None:
+    first, second = mockClient(), mockClient()
+
+    async def main() -> list:
+        with first.rawPayloads(False):
+            inside = await asyncio.gather(first.getTrack(1), second.getTrack(1), asyncio.ensure_future(first.getTrack(2)))
+
+        return [*inside, await first.getTrack(3)]
+
+    tracks = asyncio.run(main())
+
+    assert [track.raw is not None for track in tracks] == [False, True, False, True]
\ No newline at end of file
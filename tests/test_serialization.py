@@ -0,0 +1,39 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+import json
+from pathlib import Path
+
+from geniux.types import Track
+
+song = json.loads((Path(__file__).parent / "fixtures" / "song.json").read_text())
+
+def testToDictMatchesRepr(mockClient) -> None:
+    track = mockClient()._finalizeResponse(song, Track)
+
+    assert track.toDict() == json.loads(repr(track))
+    assert json.loads(track.toJSON()) == track.toDict()
+    assert track.toJSON(compact=False) == repr(track)
+
+
+def testNoneFieldsAreOmitted(mockClient) -> None:
+    track = mockClient(keepRaw=False)._finalizeResponse(song, Track)
+    result = track.toDict()
+
+    assert "raw" not in result
+    assert None not in result.values()
\ No newline at end of file
@@ -0,0 +1,73 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+
+from geniux import Client
+
+followers = 3
+
+def testFollowersElectOneNewLeaderWhenLeaderIsCancelled() -> None:
+    calls = list()
+
+    async def fetch() -> dict:
+        calls.append(None)
+        await asyncio.sleep(.05)
+        return {"id": 1}
+
+    async def main() -> list:
+        client = Client()
+        try:
+            leader = asyncio.ensure_future(client._singleFlight("songs/1", fetch))
+            await asyncio.sleep(0)
+
+            waiting = [asyncio.ensure_future(client._singleFlight("songs/1", fetch)) for _ in range(followers)]
+            await asyncio.sleep(.01)
+
+            leader.cancel()
+            return await asyncio.gather(*waiting)
+
+        finally:
+            await client.close()
+
+    results = asyncio.run(main())
+
+    assert len(calls) == 2
+    assert results == [{"id": 1}] * followers
+
+
+def testConcurrentCallsShareOneFetch() -> None:
+    calls = list()
+
+    async def fetch() -> dict:
+        calls.append(None)
+        await asyncio.sleep(.01)
+        return {"id": 1}
+
+    async def main() -> list:
+        client = Client()
+        try:
+            return await asyncio.gather(*(client._singleFlight("songs/1", fetch) for _ in range(followers + 1)))
+
+        finally:
+            await client.close()
+
+    results = asyncio.run(main())
+
+    assert len(calls) == 1
+    assert results == [{"id": 1}] * (followers + 1)
\ No newline at end of file
@@ -0,0 +1,81 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+import httpx
+
+from conftest import handleRequest
+
+def movedPages(request: httpx.Request) -> httpx.Response:
+    if "-old-" in request.url.path:
+        return httpx.Response(404)
+
+    return handleRequest(request)
+
+
+def paths(client, start: int = 0) -> list:
+    return sorted(request.url.path for request in client.requests[start:])
+
+
+def testKnownIdSkipsRedirectForGetLyrics(mockClient) -> None:
+    client = mockClient()
+
+    assert client.getLyrics(trackId=5).html
+    assert paths(client) == ["/Artist-song-5-lyrics", "/songs/5"]
+
+    requests = len(client.requests)
+    assert client.getLyrics(trackId=5).html
+    assert paths(client, requests) == ["/Artist-song-5-lyrics"]
+
+
+def testKnownIdSkipsRedirectForGetTrack(mockClient) -> None:
+    client = mockClient()
+
+    track = client.getTrack(5, includeLyrics=True)
+    assert track.lyrics.html
+    assert paths(client) == ["/Artist-song-5-lyrics", "/api/songs/5"]
+
+    requests = len(client.requests)
+    assert client.getTrack(5, includeLyrics=True).lyrics.html
+    assert paths(client, requests) == ["/Artist-song-5-lyrics", "/api/songs/5"]
+
+
+def testMissingPageDropsKnownURLForGetLyrics(mockClient) -> None:
+    client = mockClient(movedPages)
+    client._rememberTrackURL(5, "https://genius.com/Artist-old-5-lyrics")
+
+    assert client.getLyrics(trackId=5).html
+    assert [request.url.path for request in client.requests] == ["/Artist-old-5-lyrics", "/songs/5", "/Artist-song-5-lyrics"]
+    assert client._trackURLs[5] == "https://genius.com/Artist-song-5-lyrics"
+
+
+def testMissingPageDropsKnownURLForGetTrack(mockClient) -> None:
+    client = mockClient(movedPages)
+    client._rememberTrackURL(5, "https://genius.com/Artist-old-5-lyrics")
+
+    assert client.getTrack(5, includeLyrics=True).lyrics.html
+    assert paths(client) == ["/Artist-old-5-lyrics", "/Artist-song-5-lyrics", "/api/songs/5", "/songs/5"]
+    assert client._trackURLs[5] == "https://genius.com/Artist-song-5-lyrics"
+
+
+def testMissingPageWithoutRedirectForgetsTheId(mockClient) -> None:
+    client = mockClient(lambda request: httpx.Response(404))
+    client._rememberTrackURL(5, "https://genius.com/Artist-old-5-lyrics")
+
+    assert client.getLyrics(trackId=5) is None
+    assert [request.url.path for request in client.requests] == ["/Artist-old-5-lyrics", "/songs/5"]
+    assert 5 not in client._trackURLs
\ No newline at end of file
@@ -0,0 +1,131 @@
+#  Geniux — Genius API Client Library for Python
+#  Copyright (C) 2024—present to4no4sv <https://github.com/to4no4sv/Geniux>
+#
+#  This file is part of Geniux.
+#
+#  Geniux is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Geniux is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+from time import monotonic
+
+import httpx
+import pytest
+
+from geniux import webClient
+from geniux.errors import TooHighRequestSendingRate, RetriesExhausted
+
+url = "https://genius.com/api/songs/1"
+
+@pytest.fixture(autouse=True)
+def noBackoff(monkeypatch) -> None:
+    monkeypatch.setattr(webClient, "sleepTime", 0)
+
+
+def request(responses: list, requests: list = None, **kwargs) -> tuple:
+    requests = list() if requests is None else requests
+
+    def handleRequest(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        response = responses[min(len(requests), len(responses)) - 1]
+        if isinstance(response, Exception):
+            raise response
+
+        return response
+
+    async def main() -> any:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handleRequest)) as session:
+            return await webClient.Client(session).request(url, **kwargs)
+
+    return asyncio.run(main()), requests
+
+
+@pytest.mark.parametrize("statusCode", webClient.retryStatusCodes)
+def testRetriesOnRetryableStatusCodes(statusCode: int) -> None:
+    result, requests = request([httpx.Response(statusCode), httpx.ConnectError("refused"), httpx.Response(200, json={"response": {"id": 1}})])
+
+    assert result == {"id": 1}
+    assert len(requests) == 3
+
+
+def testDoesNotRetryOtherStatusCodes() -> None:
+    result, requests = request([httpx.Response(404, json={"meta": {"status": 404}})])
+
+    assert result == {"meta": {"status": 404}}
+    assert len(requests) == 1
+
+
+def testRetryAfterIsAFloor() -> None:
+    started = monotonic()
+    result, requests = request([httpx.Response(429, headers={"Retry-After": "0.3"}), httpx.Response(200, json={"response": {"id": 1}})])
+
+    assert monotonic() - started >= .3
+    assert result == {"id": 1}
+    assert len(requests) == 2
+
+
+def testRetryAfterBeyondDeadlineFailsAtOnce() -> None:
+    started = monotonic()
+    with pytest.raises(TooHighRequestSendingRate):
+        request([httpx.Response(429, headers={"Retry-After": "30"})], deadline=5)
+
+    assert monotonic() - started < 1
+
+
+def testDeadlineCutsRetriesShort(monkeypatch) -> None:
+    monkeypatch.setattr(webClient, "retries", 1000)
+    monkeypatch.setattr(webClient, "sleepTime", .05)
+    monkeypatch.setattr(webClient, "maxSleepTime", .05)
+
+    requests = list()
+    started = monotonic()
+    with pytest.raises(RetriesExhausted):
+        request([httpx.Response(503)], requests, deadline=.5)
+
+    assert .4 < monotonic() - started < 1
+    assert 1 < len(requests) < 100
+
+
+@pytest.mark.parametrize("deadline, expected", [(None, 7), (30, 7), (2, 2)])
+def testAttemptTimeoutIsCappedByDeadline(monkeypatch, deadline: float, expected: float) -> None:
+    monkeypatch.setattr(webClient, "timeout", 7)
+    _, requests = request([httpx.Response(200, json={})], deadline=deadline)
+
+    timeout = requests[0].extensions["timeout"]
+    assert 0 < timeout["read"] <= expected
+    assert timeout["read"] > expected - 1
+
+
+@pytest.mark.parametrize("responses, error", [
+    ([httpx.Response(429)], TooHighRequestSendingRate),
+    ([httpx.Response(502), httpx.Response(503), httpx.Response(504)], RetriesExhausted),
+    ([httpx.ConnectError("refused")], RetriesExhausted),
+])
+def testRaisesWhenRetriesAreExhausted(monkeypatch, responses: list, error: type) -> None:
+    monkeypatch.setattr(webClient, "retries", 3)
+
+    with pytest.raises(error):
+        request(responses)
+
+
+def testReportsErrorTypeToCallback() -> None:
+    errors = list()
+
+    async def main() -> None:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(429))) as session:
+            await webClient.Client(session, raiseError=errors.append).request(url)
+
+    with pytest.raises(TooHighRequestSendingRate):
+        asyncio.run(main())
+
+    assert errors == ["tooHighRequestSendingRate"]
\ No newline at end of file
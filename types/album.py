@@ -16,14 +16,14 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
 
-import copy
 from typing import Union, List
 from datetime import datetime
 
 from geniux.aio import asyncFunction
 from geniux.config import Genius
 from geniux.enums import Sort, TextFormat
-from geniux.utils import parsePhoto, cleanTitle, artistsToStr
+from geniux.utils import parsePhoto, artistsToStr
+from geniux.normalization import normalizeTitle
 
 from .base import Base
 from .photo import Photo
@@ -32,11 +32,33 @@ from .coverArt import CoverArt
 from .track import Track
 
 class Album(Base, Photo):
+    __slots__ = (
+        "title",
+        "primaryArtist",
+        "artist",
+        "photo",
+        "header",
+        "description",
+        "releaseDate",
+        "tracks",
+        "lockState",
+        "coverArts",
+        "stats",
+        "id",
+        "artistDomain",
+        "albumDomain",
+        "domain",
+        "url",
+        "raw",
+    )
+
+    _shared = True
+
     def __init__(self, album: dict, client: "Client" = None) -> None:
         from .artist import Artist
         super().__init__(client)
 
-        self.title = cleanTitle(album.get("name"))
+        self.title = normalizeTitle(album.get("name"))
 
         primaryArtist = album.get("artist")
         self.primaryArtist = self._client._finalizeResponse(
@@ -72,14 +94,15 @@ class Album(Base, Photo):
         coverArts = album.get("cover_arts")
         self.coverArts = [
             self._client._finalizeResponse(
-                {
-                    **coverArt,
-                    **{"album": copy.copy(self)},
-                },
-                CoverArt)
+                coverArt,
+                CoverArt,
+            )
             for coverArt in coverArts
         ] if coverArts else None
 
+        for coverArt in self.coverArts or ():
+            coverArt.album = self
+
         self.stats = self._client._finalizeResponse(
             {
                 "tracks": (len(self.tracks) if isinstance(self.tracks, list) else 1) if self.tracks else None,
@@ -98,7 +121,7 @@ class Album(Base, Photo):
 
         self.url = f"{Genius}albums/{self.domain}"
 
-        self.raw = album
+        self.raw = album if self._client._keepsRaw() else None
 
 
     @asyncFunction
@@ -28,6 +28,32 @@ from .stats import Stats
 from .comment import Comment
 
 class Annotation(Base):
+    __slots__ = (
+        "lyrics",
+        "text",
+        "state",
+        "createdAt",
+        "description",
+        "image",
+        "beingCreated",
+        "community",
+        "deleted",
+        "verified",
+        "hasVoters",
+        "source",
+        "customPreview",
+        "acceptedBy",
+        "verifiedBy",
+        "rejectionComment",
+        "topComment",
+        "authors",
+        "track",
+        "stats",
+        "id",
+        "url",
+        "raw",
+    )
+
     def __init__(self, annotation: dict, client: "Client" = None) -> None:
         from .track import Track
         from .user import User
@@ -140,7 +166,7 @@ class Annotation(Base):
         self.id = annotation.get("id") or int(annotation.get("api_path").replace("/referents/", str()))
         self.url = f"{Genius}{self.id}"
 
-        self.raw = annotation
+        self.raw = annotation if self._client._keepsRaw() else None
 
 
     @asyncFunction
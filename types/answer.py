@@ -22,6 +22,20 @@ from .base import Base
 from .stats import Stats
 
 class Answer(Base):
+    __slots__ = (
+        "text",
+        "textForEdit",
+        "createdAt",
+        "state",
+        "source",
+        "hasVoters",
+        "authors",
+        "question",
+        "stats",
+        "id",
+        "raw",
+    )
+
     def __init__(self, answer: dict, client: "Client" = None) -> None:
         from .user import User
         from .question import Question
@@ -82,4 +96,4 @@ class Answer(Base):
 
         self.id = answer.get("id")
 
-        self.raw = answer
\ No newline at end of file
+        self.raw = answer if self._client._keepsRaw() else None
\ No newline at end of file
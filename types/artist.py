@@ -20,8 +20,9 @@ from typing import Union, List
 
 from geniux.aio import asyncFunction
 from geniux.config import Genius
-from geniux.utils import parsePhoto, cleanArtists
+from geniux.utils import parsePhoto
 from geniux.enums import Sort, TextFormat
+from geniux.normalization import normalizeArtists
 from .base import Base
 from .photo import Photo
 from .stats import Stats
@@ -29,13 +30,39 @@ from .album import Album
 from .track import Track
 
 class Artist(Base, Photo):
+    __slots__ = (
+        "nickname",
+        "alternativeNicknames",
+        "photo",
+        "header",
+        "description",
+        "indexCharacter",
+        "memeVerified",
+        "verified",
+        "translation",
+        "instagram",
+        "twitter",
+        "facebook",
+        "albums",
+        "tracks",
+        "user",
+        "role",
+        "stats",
+        "id",
+        "domain",
+        "url",
+        "raw",
+    )
+
+    _shared = True
+
     def __init__(self, artist: dict, client: "Client" = None) -> None:
         from .user import User
         super().__init__(client)
 
-        self.nickname = cleanArtists(artist.get("name"))
+        self.nickname = normalizeArtists(artist.get("name"))
         alternativeNicknames = artist.get("alternate_names")
-        self.alternativeNicknames = [cleanArtists(alternativeNickname) for alternativeNickname in alternativeNicknames] if alternativeNicknames else None
+        self.alternativeNicknames = [normalizeArtists(alternativeNickname) for alternativeNickname in alternativeNicknames] if alternativeNicknames else None
 
         self.photo = parsePhoto(artist.get("image_url"))
         self.header = parsePhoto(artist.get("header_image_url"))
@@ -74,7 +101,7 @@ class Artist(Base, Photo):
         self.domain = artist.get("slug")
         self.url = f"{Genius}artists/{self.domain}"
 
-        self.raw = artist
+        self.raw = artist if self._client._keepsRaw() else None
 
 
     @asyncFunction
@@ -16,14 +16,20 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
 
-from json import JSONEncoder
+from datetime import datetime, date
+from enum import Enum
+from json import JSONEncoder, dumps
+from typing import Iterator, Tuple
+
+try:
+    import orjson
+
+except ImportError:
+    orjson = None
 
 class Encoder(JSONEncoder):
     def default(self, o) -> any:
-        from enum import Enum
-        from datetime import datetime, date
-
-        if any((class_.__name__ == "Base" for class_ in o.__class__.__bases__)):
+        if isinstance(o, Base):
             return o._toDict()
 
         elif isinstance(o, Enum):
@@ -41,27 +47,173 @@ class Encoder(JSONEncoder):
         return super().default(o)
 
 
+encoder = Encoder()
+
+
+def toPlain(value: any) -> any:
+    if isinstance(value, (str, int, float)) or value is None:
+        return value
+
+    elif isinstance(value, Base):
+        return {key: toPlain(value_) for key, value_ in value._toDict().items()}
+
+    elif isinstance(value, dict):
+        return {key: toPlain(value_) for key, value_ in value.items()}
+
+    elif isinstance(value, (list, tuple)):
+        return [toPlain(item) for item in value]
+
+    return encoder.default(value)
+
+
+hiddenSlots = ("_source", "_payloadKeys", "_structure", "__weakref__")
+
 class Base:
+    __slots__ = ("_client", "_source", "_payloadKeys", "__weakref__")
+
+    _lazyFields = ()
+    _emptiableFields = ("stats",)
+    _shared = False
+    _slotNames = ("_client",)
+    _plan = ()
+
     def __init__(self, client: "Client") -> None:
         self._client = client
 
 
+    def _hydrate(self, source: dict) -> None:
+        if self._client._lazy:
+            self._source = source
+            return
+
+        for field in self._lazyFields:
+            setattr(self, field, self._build(field, source))
+
+
+    def _build(self, field: str, source: dict) -> any:
+        return getattr(self, f"_build{field[0].upper()}{field[1:]}")(source)
+
+
+    def __getattr__(self, name: str) -> any:
+        if name not in type(self)._lazyFields:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        value = self._build(name, self._source)
+        setattr(self, name, value)
+
+        if self._isHydrated():
+            del self._source
+
+        return value
+
+
+    def _isHydrated(self) -> bool:
+        for field in type(self)._lazyFields:
+            try:
+                object.__getattribute__(self, field)
+
+            except AttributeError:
+                return False
+
+        return True
+
+
+    def __copy__(self) -> "Base":
+        copy = object.__new__(type(self))
+        for class_ in type(self).__mro__:
+            for key in class_.__dict__.get("__slots__", ()):
+                if key == "__weakref__":
+                    continue
+
+                try:
+                    setattr(copy, key, object.__getattribute__(self, key))
+
+                except AttributeError:
+                    pass
+
+        return copy
+
+
+    def _merge(self, other: "Base") -> None:
+        for key, value in other._fields():
+            if value is None or key == "_client":
+                continue
+
+            current = getattr(self, key, None)
+            if isinstance(value, Base) and type(current) is type(value) and not value._shared:
+                current._merge(value)
+
+            else:
+                setattr(self, key, value)
+
+
     def _toDict(self) -> dict:
         from types import FunctionType, MethodType
 
-        from geniux.types import Track
-
         result = dict()
-        for key, value in self.__dict__.items():
-            if any((value is None, value and (key == "stats" or (isinstance(self, Track) and key == "lyrics")) and sum(1 for key_ in value.__dict__ if value.__dict__[key_] is not None) == (2 if key == "stats" else 4), isinstance(value, (FunctionType, MethodType)), key in ["_client", "raw"])):
+        for key, name, mayBeEmpty in self._plan:
+            try:
+                value = getattr(self, key)
+
+            except AttributeError:
+                continue
+
+            if value is None or (mayBeEmpty and value and value._isEmpty()) or isinstance(value, (FunctionType, MethodType)):
                 continue
 
-            result[key if not key.startswith("_") else key[1:]] = value
+            result[name] = value
 
         return result
 
 
-    def __repr__(self) -> str:
-        from json import dumps
+    def _isEmpty(self) -> bool:
+        return all(value is None for key, value in self._fields() if key not in ("_client", "raw"))
+
+
+    def _fields(self) -> Iterator[Tuple[str, any]]:
+        for key in self._slotNames:
+            try:
+                yield key, getattr(self, key)
 
+            except AttributeError:
+                pass
+
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+
+        cls._slotNames = tuple(key for class_ in reversed(cls.__mro__) for key in class_.__dict__.get("__slots__", ()) if key not in hiddenSlots)
+        cls._plan = tuple(
+            (key, key[1:] if key.startswith("_") else key, key in cls._emptiableFields)
+            for key in cls._slotNames
+            if key not in ("_client", "raw")
+        )
+
+
+    def toDict(self) -> dict:
+        """
+        Возвращает объект в виде словаря из простых типов (`dict`, `list`, `str`, `int`, `float`, `bool`), пригодного для сериализации в JSON. Поля со значением `None` опускаются.
+        """
+
+        return toPlain(self)
+
+
+    def toJSON(self, compact: bool = True) -> str:
+        """
+        Сериализует объект в JSON. Если установлен `orjson`, он используется для компактного вывода.
+
+        Аргументы:
+            compact (bool, optional): Без отступов и пробелов (по умолчанию). Если `False`, результат совпадает с `repr` объекта.
+        """
+
+        if not compact:
+            return repr(self)
+
+        if orjson:
+            return orjson.dumps(toPlain(self)).decode()
+
+        return dumps(toPlain(self), ensure_ascii=False, separators=(",", ":"))
+
+
+    def __repr__(self) -> str:
         return dumps(self._toDict(), indent=4, ensure_ascii=False, cls=Encoder)
\ No newline at end of file
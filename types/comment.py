@@ -23,6 +23,23 @@ from .base import Base
 from .stats import Stats
 
 class Comment(Base):
+    __slots__ = (
+        "text",
+        "state",
+        "disposition",
+        "createdAt",
+        "deletedAt",
+        "hasVoters",
+        "anonymousAuthor",
+        "author",
+        "commentableType",
+        "commentable",
+        "stats",
+        "id",
+        "url",
+        "raw",
+    )
+
     def __init__(self, comment: dict, client: "Client" = None) -> None:
         from .album import Album
         from .annotation import Annotation
@@ -70,4 +87,4 @@ class Comment(Base):
         self.id = comment.get("id")
         self.url = f"{Genius}comments/{self.id}"
 
-        self.raw = comment
\ No newline at end of file
+        self.raw = comment if self._client._keepsRaw() else None
\ No newline at end of file
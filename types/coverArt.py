@@ -16,6 +16,9 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
 
+from typing import Union
+from weakref import ref
+
 from geniux.config import Genius
 from geniux.utils import parsePhoto
 
@@ -23,6 +26,15 @@ from .base import Base
 from .photo import Photo
 
 class CoverArt(Base, Photo):
+    __slots__ = (
+        "photo",
+        "annotated",
+        "_album",
+        "id",
+        "url",
+        "raw",
+    )
+
     def __init__(self, coverArt: dict, client: "Client" = None) -> None:
         super().__init__(client)
 
@@ -30,12 +42,30 @@ class CoverArt(Base, Photo):
 
         self.annotated = coverArt.get("annotated")
 
-        album = coverArt.get("album")
-        if album:
-            album.coverArts = None
-        self.album = album
+        self.album = coverArt.get("album")
 
         self.id = coverArt.get("id")
         self.url = f"{Genius}album_cover_arts/{self.id}"
 
-        self.raw = coverArt
\ No newline at end of file
+        self.raw = coverArt if self._client._keepsRaw() else None
+
+
+    @property
+    def album(self) -> Union["Album", None]:
+        return self._album() if self._album is not None else None
+
+
+    @album.setter
+    def album(self, album: Union["Album", None]) -> None:
+        self._album = ref(album) if album is not None else None
+
+
+    def _toDict(self) -> dict:
+        result = super()._toDict()
+        result.pop("album", None)
+
+        album = self.album
+        if album is not None:
+            result["album"] = {key: value for key, value in album._toDict().items() if key != "coverArts"}
+
+        return result
\ No newline at end of file
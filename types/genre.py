@@ -16,15 +16,24 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
 
-from geniux.utils import cleanTitle
+from geniux.normalization import normalizeTitle
 
 from .base import Base
 
 class Genre(Base):
+    __slots__ = (
+        "title",
+        "primary",
+        "id",
+        "domain",
+        "url",
+        "raw",
+    )
+
     def __init__(self, genre: dict, client: "Client" = None) -> None:
         super().__init__(client)
 
-        self.title = cleanTitle(genre.get("name"))
+        self.title = normalizeTitle(genre.get("name"))
         self.primary = genre.get("primary")
 
         self.id = genre.get("id")
@@ -32,4 +41,4 @@ class Genre(Base):
         self.domain = url.replace("https://genius.com/tags/", str()) if url else None
         self.url = url
 
-        self.raw = genre
\ No newline at end of file
+        self.raw = genre if self._client._keepsRaw() else None
\ No newline at end of file
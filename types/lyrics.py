@@ -16,12 +16,39 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
 
+from typing import Union
+from weakref import ref
+
 from geniux.utils import unixToDatetime
 
 from .base import Base
 from .stats import Stats
 
 class Lyrics(Base):
+    __slots__ = (
+        "_plain",
+        "html",
+        "_markdown",
+        "_markdownV2",
+        "instrumental",
+        "state",
+        "verified",
+        "explicit",
+        "music",
+        "language",
+        "lyricsPlaceholderReason",
+        "hasInstagramReelAnnotations",
+        "verifiedBy",
+        "markedCompleteBy",
+        "staffApprovedBy",
+        "updatedAt",
+        "owner",
+        "stats",
+        "_track",
+        "raw",
+        "_structure",
+    )
+
     def __init__(self, lyrics: dict, client: "Client" = None) -> None:
         from .user import User
         super().__init__(client)
@@ -29,10 +56,10 @@ class Lyrics(Base):
         track = lyrics.get("track")
         trackLyrics = getattr(track, "lyrics", None) if track else None
 
-        self.plain = lyrics.get("plain")
+        self._plain = lyrics.get("plain")
         self.html = lyrics.get("html")
-        self.markdown = lyrics.get("markdown")
-        self.markdownV2 = lyrics.get("markdownV2")
+        self._markdown = lyrics.get("markdown")
+        self._markdownV2 = lyrics.get("markdownV2")
 
         self.instrumental = lyrics.get("instrumental") or (trackLyrics.instrumental if trackLyrics else None)
         self.state = lyrics.get("state") or (trackLyrics.state if trackLyrics else None)
@@ -83,11 +110,76 @@ class Lyrics(Base):
             Stats,
         )
 
-        if track:
-            track.lyrics = None
-            self.track = track
+        self.track = track
+
+        self.raw = lyrics if self._client._keepsRaw() else None
+
+        self._structure = None
+
+
+    @property
+    def plain(self) -> Union[str, None]:
+        if self._plain is None and self.html is not None:
+            from geniux.lyricsParser import toPlain
+
+            self._plain = toPlain(self.html)
+
+        return self._plain
+
+
+    @property
+    def markdown(self) -> Union[str, None]:
+        if self._markdown is None and self.html is not None:
+            from geniux.lyricsParser import toMarkdown
+
+            self._markdown = toMarkdown(self.html)
+
+        return self._markdown
+
+
+    @property
+    def markdownV2(self) -> Union[str, None]:
+        if self._markdownV2 is None and self.html is not None:
+            from geniux.lyricsParser import toMarkdown
+
+            self._markdownV2 = toMarkdown(self.html, v2=True)
+
+        return self._markdownV2
+
+
+    @property
+    def track(self) -> Union["Track", None]:
+        return self._track() if self._track is not None else None
+
+
+    @track.setter
+    def track(self, track: Union["Track", None]) -> None:
+        self._track = ref(track) if track is not None else None
+
+
+    @property
+    def structure(self) -> Union["LyricsStructure", None]:
+        if self._structure is None and self.plain is not None:
+            from geniux.lyricsStructure import LyricsStructure
+
+            self._structure = LyricsStructure(self.plain)
+
+        return self._structure
+
+
+    def _isEmpty(self) -> bool:
+        return all(value is None for key, value in self._fields() if key not in ("_client", "raw", "stats", "_track"))
+
+
+    def _toDict(self) -> dict:
+        for textFormat in ("plain", "markdown", "markdownV2"):
+            getattr(self, textFormat)
+
+        result = super()._toDict()
+        result.pop("track", None)
 
-        else:
-            self.track = None
+        track = self.track
+        if track is not None:
+            result["track"] = {key: value for key, value in track._toDict().items() if key != "lyrics"}
 
-        self.raw = lyrics
\ No newline at end of file
+        return result
\ No newline at end of file
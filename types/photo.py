@@ -19,5 +19,7 @@
 from typing import Union
 
 class Photo:
+    __slots__ = ()
+
     def resizePhoto(self, resolution: int) -> Union[str, None]:
         return f"https://t2.genius.com/unsafe/{resolution}x{resolution}/{self.photo}" if self.photo and "default_" not in self.photo and not self.photo.startswith("filepicker-images") else self.photo
\ No newline at end of file
@@ -21,6 +21,16 @@ from geniux.utils import unixToDatetime
 from .base import Base
 
 class Pyong(Base):
+    __slots__ = (
+        "text",
+        "createdAt",
+        "user",
+        "pyongableType",
+        "pyongable",
+        "id",
+        "raw",
+    )
+
     def __init__(self, pyong: dict, client: "Client" = None) -> None:
         from .album import Album
         from .annotation import Annotation
@@ -52,4 +62,4 @@ class Pyong(Base):
 
         self.id = pyong.get("id")
 
-        self.raw = pyong
\ No newline at end of file
+        self.raw = pyong if self._client._keepsRaw() else None
\ No newline at end of file
@@ -22,6 +22,24 @@ from .base import Base
 from .stats import Stats
 
 class Question(Base):
+    __slots__ = (
+        "text",
+        "createdAt",
+        "state",
+        "pinOrder",
+        "hasVoters",
+        "defaultKey",
+        "defaultQuestion",
+        "author",
+        "questionableType",
+        "questionable",
+        "answer",
+        "stats",
+        "id",
+        "url",
+        "raw",
+    )
+
     def __init__(self, question: dict, client: "Client" = None) -> None:
         from .album import Album
         from .annotation import Annotation
@@ -74,4 +92,4 @@ class Question(Base):
         self.id = question.get("id")
         self.url = question.get("url")
 
-        self.raw = question
\ No newline at end of file
+        self.raw = question if self._client._keepsRaw() else None
\ No newline at end of file
@@ -19,6 +19,34 @@
 from .base import Base
 
 class Stats(Base):
+    __slots__ = (
+        "tracks",
+        "votes",
+        "IQ",
+        "followedUsers",
+        "followers",
+        "roles",
+        "views",
+        "concurrents",
+        "coverArts",
+        "pendingEdits",
+        "verifiedBy",
+        "contributors",
+        "IQEarners",
+        "transcribers",
+        "annotations",
+        "transcribes",
+        "questions",
+        "answers",
+        "forumPosts",
+        "verifiedAnnotations",
+        "acceptedAnnotations",
+        "unreviewedAnnotations",
+        "comments",
+        "pyongs",
+        "raw",
+    )
+
     def __init__(self, stats: dict, client: "Client" = None) -> None:
         super().__init__(client)
 
@@ -56,4 +84,4 @@ class Stats(Base):
         self.comments = stats.get("comments")
         self.pyongs = stats.get("pyongs")
 
-        self.raw = stats
\ No newline at end of file
+        self.raw = stats if self._client._keepsRaw() else None
\ No newline at end of file
@@ -16,14 +16,14 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
 
-import copy
 from typing import Union, List
 from datetime import datetime
 
 from geniux.aio import asyncFunction
 from geniux.config import Genius
 from geniux.enums import TextFormat, Role, Color
-from geniux.utils import unixToDatetime, parsePhoto, cleanTitle, artistsToStr
+from geniux.utils import unixToDatetime, parsePhoto, artistsToStr
+from geniux.normalization import normalizeTitle
 
 from .base import Base
 from .stats import Stats
@@ -33,22 +33,160 @@ from .genre import Genre
 from .annotation import Annotation
 
 class Track(Base, Photo):
+    __slots__ = (
+        "title",
+        "primaryArtist",
+        "featuredArtists",
+        "artist",
+        "producers",
+        "writers",
+        "photo",
+        "header",
+        "description",
+        "primaryColor",
+        "secondColor",
+        "textColor",
+        "releaseDate",
+        "primaryGenre",
+        "genres",
+        "albums",
+        "updatedAt",
+        "transcribedAt",
+        "youtube",
+        "startSecond",
+        "featuredVideo",
+        "soundcloud",
+        "appleMusic",
+        "spotify",
+        "vttpId",
+        "released",
+        "recordingLocation",
+        "hidden",
+        "viewableByRoles",
+        "number",
+        "translations",
+        "verifiedContributors",
+        "verifiedAnnotationsBy",
+        "customRoles",
+        "hot",
+        "stats",
+        "id",
+        "artistDomain",
+        "trackDomain",
+        "domain",
+        "url",
+        "lyrics",
+        "raw",
+    )
+
+    _emptiableFields = ("stats", "lyrics")
+    _lazyFields = (
+        "primaryArtist",
+        "featuredArtists",
+        "artist",
+        "producers",
+        "writers",
+        "primaryGenre",
+        "genres",
+        "albums",
+        "translations",
+        "verifiedContributors",
+        "verifiedAnnotationsBy",
+        "customRoles",
+        "stats",
+        "lyrics",
+    )
+
     def __init__(self, track: dict, client: "Client" = None) -> None:
-        from .artist import Artist
-        from .album import Album
-        from .user import User
         super().__init__(client)
 
-        self.title = cleanTitle(track.get("title"))
+        self.title = normalizeTitle(track.get("title"))
+
+        self.photo = parsePhoto(track.get("song_art_image_url"))
+        self.header = parsePhoto(track.get("header_image_url"))
+
+        description = track.get("description")
+        self.description = description.get("plain") or description.get("dom") or description.get("html") or description.get("markdown") if description else None
+
+        self.primaryColor = track.get("song_art_primary_color")
+        self.secondColor = track.get("song_art_secondary_color")
+        textColor = track.get("song_art_text_color")
+        self.textColor = (Color.White if textColor == "#fff" else Color.Black) if textColor else None
+
+        releaseDateComponents = track.get("release_date_components")
+        if releaseDateComponents and all(releaseDateComponents.get(component) for component in ["day", "month", "year"]):
+            day = releaseDateComponents.get("day")
+            month = releaseDateComponents.get("month")
+            year = releaseDateComponents.get("year")
+            self.releaseDate = datetime(year, month, day).date()
+
+        else:
+            self.releaseDate = None
+
+        timeStamps = track.get("client_timestamps")
+
+        updatedAt = track.get("updated_by_human_at") or (timeStamps.get("updated_by_human_at") if timeStamps else None)
+        self.updatedAt = unixToDatetime(updatedAt) if updatedAt else None
+
+        transcribedAt = track.get("transcribedAt")
+        self.transcribedAt = unixToDatetime(transcribedAt) if transcribedAt else None
+
+        youtubeUrl = track.get("youtube_url")
+        self.youtube = youtubeUrl.replace("http://www.youtube.com/watch?v=", str()) if youtubeUrl else None
+        self.startSecond = track.get("youtube_start")
+        self.featuredVideo = track.get("featured_video")
+        self.soundcloud = track.get("soundcloud_url")
+        self.appleMusic = track.get("apple_music_id")
+        self.spotify = track.get("spotify_uuid")
+        self.vttpId = track.get("vttp_id")
+
+        self.released = track.get("published")
+        self.recordingLocation = track.get("recording_location")
+
+        self.hidden = track.get("hidden")
+        viewableByRoles = track.get("viewable_by_roles")
+        self.viewableByRoles = [
+            Role(viewableByRole.replace("_a", "A"))
+            for viewableByRole in viewableByRoles
+        ] if self.hidden and viewableByRoles else None
+
+        self.number = track.get("number")
+
+        stats = track.get("stats")
+        self.hot = stats.get("hot") if stats else None
+
+        self.id = track.get("id") or int(track.get("api_path").replace("/songs/", str()))
 
         primaryArtist = track.get("primary_artist")
-        self.primaryArtist = self._client._finalizeResponse(
+        self.artistDomain = primaryArtist.get("slug") if primaryArtist else None
+        domain = track.get("path")
+        domain = domain[1:-7] if domain else track.get("url").replace("https://genius.com/", str())[:-7]
+        self.trackDomain = domain.replace(f"{self.artistDomain}-", str()) if self.artistDomain else None
+        self.domain = f"{self.artistDomain}-{self.trackDomain}" if self.artistDomain else domain
+
+        self.url = f'{Genius}{self.domain}-lyrics'
+        self._client._rememberTrackURL(self.id, track.get("url") or self.url)
+
+        self._hydrate(track)
+
+        self.raw = track if self._client._keepsRaw() else None
+
+
+    def _buildPrimaryArtist(self, track: dict) -> Union["Artist", None]:
+        from .artist import Artist
+
+        primaryArtist = track.get("primary_artist")
+        return self._client._finalizeResponse(
             primaryArtist,
             Artist,
         ) if primaryArtist else None
 
+
+    def _buildFeaturedArtists(self, track: dict) -> Union[List["Artist"], None]:
+        from .artist import Artist
+
         featuredArtists = track.get("featured_artists")
-        self.featuredArtists = [
+        return [
             self._client._finalizeResponse(
                 featuredArtist,
                 Artist,
@@ -56,10 +194,16 @@ class Track(Base, Photo):
             for featuredArtist in featuredArtists
         ] if featuredArtists else None
 
-        self.artist = artistsToStr(self.primaryArtist, self.featuredArtists)
+
+    def _buildArtist(self, track: dict) -> Union[str, None]:
+        return artistsToStr(self.primaryArtist, self.featuredArtists)
+
+
+    def _buildProducers(self, track: dict) -> Union[List["Artist"], None]:
+        from .artist import Artist
 
         producers = track.get("producer_artists")
-        self.producers = [
+        return [
             self._client._finalizeResponse(
                 producer,
                 Artist,
@@ -67,8 +211,12 @@ class Track(Base, Photo):
             for producer in producers
         ] if producers else None
 
+
+    def _buildWriters(self, track: dict) -> Union[List["Artist"], None]:
+        from .artist import Artist
+
         writers = track.get("writer_artists")
-        self.writers = [
+        return [
             self._client._finalizeResponse(
                 writer,
                 Artist,
@@ -76,35 +224,18 @@ class Track(Base, Photo):
             for writer in writers
         ] if writers else None
 
-        self.photo = parsePhoto(track.get("song_art_image_url"))
-        self.header = parsePhoto(track.get("header_image_url"))
-
-        description = track.get("description")
-        self.description = description.get("plain") or description.get("dom") or description.get("html") or description.get("markdown") if description else None
-
-        self.primaryColor = track.get("song_art_primary_color")
-        self.secondColor = track.get("song_art_secondary_color")
-        textColor = track.get("song_art_text_color")
-        self.textColor = (Color.White if textColor == "#fff" else Color.Black) if textColor else None
-
-        releaseDateComponents = track.get("release_date_components")
-        if releaseDateComponents and all(releaseDateComponents.get(component) for component in ["day", "month", "year"]):
-            day = releaseDateComponents.get("day")
-            month = releaseDateComponents.get("month")
-            year = releaseDateComponents.get("year")
-            self.releaseDate = datetime(year, month, day).date()
-
-        else:
-            self.releaseDate = None
 
+    def _buildPrimaryGenre(self, track: dict) -> Union[Genre, None]:
         primaryGenre = track.get("primary_tag")
-        self.primaryGenre = self._client._finalizeResponse(
+        return self._client._finalizeResponse(
             primaryGenre,
             Genre,
         ) if primaryGenre else None
 
+
+    def _buildGenres(self, track: dict) -> Union[List[Genre], None]:
         genres = track.get("tags")
-        self.genres = [
+        return [
             self._client._finalizeResponse(
                 genre,
                 Genre,
@@ -112,8 +243,12 @@ class Track(Base, Photo):
             for genre in genres
         ] if genres else None
 
+
+    def _buildAlbums(self, track: dict) -> Union[List["Album"], None]:
+        from .album import Album
+
         albums = track.get("albums")
-        self.albums = [
+        albums = [
             self._client._finalizeResponse(
                 album,
                 Album,
@@ -121,46 +256,21 @@ class Track(Base, Photo):
             for album in albums
         ] if albums else None
 
-        if not self.albums:
+        if not albums:
             album = track.get("album")
-            self.albums = [
+            albums = [
                 self._client._finalizeResponse(
                     album,
                     Album,
                 )
             ] if album else None
 
-        timeStamps = track.get("client_timestamps")
+        return albums
 
-        updatedAt = track.get("updated_by_human_at") or (timeStamps.get("updated_by_human_at") if timeStamps else None)
-        self.updatedAt = unixToDatetime(updatedAt) if updatedAt else None
-
-        transcribedAt = track.get("transcribedAt")
-        self.transcribedAt = unixToDatetime(transcribedAt) if transcribedAt else None
-
-        youtubeUrl = track.get("youtube_url")
-        self.youtube = youtubeUrl.replace("http://www.youtube.com/watch?v=", str()) if youtubeUrl else None
-        self.startSecond = track.get("youtube_start")
-        self.featuredVideo = track.get("featured_video")
-        self.soundcloud = track.get("soundcloud_url")
-        self.appleMusic = track.get("apple_music_id")
-        self.spotify = track.get("spotify_uuid")
-        self.vttpId = track.get("vttp_id")
-
-        self.released = track.get("published")
-        self.recordingLocation = track.get("recording_location")
-
-        self.hidden = track.get("hidden")
-        viewableByRoles = track.get("viewable_by_roles")
-        self.viewableByRoles = [
-            Role(viewableByRole.replace("_a", "A"))
-            for viewableByRole in viewableByRoles
-        ] if self.hidden and viewableByRoles else None
-
-        self.number = track.get("number")
 
+    def _buildTranslations(self, track: dict) -> Union[List["Track"], None]:
         translations = track.get("translation_songs")
-        self.translations = [
+        return [
             self._client._finalizeResponse(
                 translation,
                 Track,
@@ -168,8 +278,12 @@ class Track(Base, Photo):
             for translation in translations
         ] if translations else None
 
+
+    def _buildVerifiedContributors(self, track: dict) -> Union[List["User"], None]:
+        from .user import User
+
         verifiedContributors = track.get("verified_contributors")
-        self.verifiedContributors = [
+        return [
             self._client._finalizeResponse(
                 user,
                 User,
@@ -177,8 +291,12 @@ class Track(Base, Photo):
             for user in verifiedContributors
         ] if verifiedContributors else None
 
+
+    def _buildVerifiedAnnotationsBy(self, track: dict) -> Union[List["User"], None]:
+        from .user import User
+
         verifiedAnnotationsBy = track.get("verified_annotations_by")
-        self.verifiedAnnotationsBy = [
+        return [
             self._client._finalizeResponse(
                 user,
                 User,
@@ -186,8 +304,12 @@ class Track(Base, Photo):
             for user in verifiedAnnotationsBy
         ] if verifiedAnnotationsBy else None
 
+
+    def _buildCustomRoles(self, track: dict) -> Union[List["Artist"], None]:
+        from .artist import Artist
+
         customRoles = track.get("custom_performances")
-        self.customRoles = [
+        return [
             self._client._finalizeResponse(
                 {
                     **artist,
@@ -201,9 +323,10 @@ class Track(Base, Photo):
             for artist in customRole.get("artists")
         ] if customRoles else None
 
+
+    def _buildStats(self, track: dict) -> Stats:
         stats = track.get("stats")
         if stats:
-            self.hot = stats.get("hot")
             views = stats.get("pageviews")
             concurrentCount = stats.get("concurrents")
             contributorCount = stats.get("contributors")
@@ -214,7 +337,6 @@ class Track(Base, Photo):
             unreviewedAnnotationCount = stats.get("unreviewed_annotations")
 
         else:
-            self.hot = None
             views = None
             concurrentCount = None
             contributorCount = None
@@ -228,7 +350,7 @@ class Track(Base, Photo):
         pyongCount = track.get("pyongs_count")
         commentCount = track.get("comment_count")
 
-        self.stats = self._client._finalizeResponse(
+        return self._client._finalizeResponse(
             {
                 "views": views,
                 "concurrents": concurrentCount,
@@ -245,18 +367,12 @@ class Track(Base, Photo):
             Stats,
         )
 
-        self.id = track.get("id") or int(track.get("api_path").replace("/songs/", str()))
 
-        self.artistDomain = self.primaryArtist.domain if self.primaryArtist else None
-        domain = track.get("path")
-        domain = domain[1:-7] if domain else track.get("url").replace("https://genius.com/", str())[:-7]
-        self.trackDomain = domain.replace(f"{self.artistDomain}-", str()) if self.artistDomain else None
-        self.domain = f"{self.artistDomain}-{self.trackDomain}" if self.artistDomain else domain
-
-        self.url = f'{Genius}{self.domain}-lyrics'
+    def _buildLyrics(self, track: dict) -> Lyrics:
+        timeStamps = track.get("client_timestamps")
 
         lyrics = track.get("lyrics")
-        self.lyrics = self._client._finalizeResponse(
+        lyrics = self._client._finalizeResponse(
             {
                 **(
                     {
@@ -274,14 +390,13 @@ class Track(Base, Photo):
                         "staffApprovedBy": track.get("lyrics_marked_staff_approved_by"),
                         "updatedAt": track.get("lyrics_updated_at") or (timeStamps.get("lyrics_updated_at") if timeStamps else None),
                         "ownerId": track.get("lyrics_owner_id"),
-                        "track": copy.copy(self),
                     }
                 ),
                 **(
                     {
-                        "plain": lyrics.plain,
-                        "markdown": lyrics.markdown,
-                        "markdownV2": lyrics.markdownV2,
+                        "plain": lyrics._plain,
+                        "markdown": lyrics._markdown,
+                        "markdownV2": lyrics._markdownV2,
                         "html": lyrics.html,
                         "instrumental": lyrics.instrumental,
                     }
@@ -291,7 +406,9 @@ class Track(Base, Photo):
             Lyrics,
         )
 
-        self.raw = track
+        lyrics.track = self
+
+        return lyrics
 
 
     @asyncFunction
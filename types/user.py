@@ -21,7 +21,8 @@ from typing import Union, List
 from geniux.aio import asyncFunction
 from geniux.config import Genius
 from geniux.enums import Sort, TextFormat, Role
-from geniux.utils import parsePhoto, cleanArtists
+from geniux.utils import parsePhoto
+from geniux.normalization import normalizeArtists
 
 from .base import Base
 from .stats import Stats
@@ -34,15 +35,36 @@ from .question import Question
 from .answer import Answer
 
 class User(Base, Photo):
+    __slots__ = (
+        "nickname",
+        "login",
+        "alternativeNicknames",
+        "photo",
+        "header",
+        "description",
+        "memeVerified",
+        "verified",
+        "roles",
+        "annotationImpact",
+        "answerImpact",
+        "artist",
+        "stats",
+        "id",
+        "url",
+        "raw",
+    )
+
+    _shared = True
+
     def __init__(self, user: dict, client: "Client" = None) -> None:
         from .artist import Artist
         super().__init__(client)
 
-        self.nickname = cleanArtists(user.get("name"))
+        self.nickname = normalizeArtists(user.get("name"))
         self.login = user.get("login")
 
         alternativeNicknames = user.get("alternate_names")
-        self.alternativeNicknames = [cleanArtists(alternativeNickname) for alternativeNickname in alternativeNicknames] if alternativeNicknames else None
+        self.alternativeNicknames = [normalizeArtists(alternativeNickname) for alternativeNickname in alternativeNicknames] if alternativeNicknames else None
 
         avatar = user.get("avatar")
         if avatar:
@@ -105,7 +127,7 @@ class User(Base, Photo):
         self.id = user.get("id")
         self.url = f"{Genius}{self.login}" if self.login else None
 
-        self.raw = user
+        self.raw = user if self._client._keepsRaw() else None
 
 
     @asyncFunction
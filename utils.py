@@ -16,7 +16,6 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Geniux. If not, see <http://www.gnu.org/licenses/>.
 
-import re
 from typing import Union, List
 from datetime import datetime
 
@@ -52,52 +51,38 @@ def clean(string: Union[str, None]) -> Union[str, None]:
     return string.strip().replace("​", str()).replace("\\xa0", " ").replace("’", "'")
 
 
-russianLetters = set("абвгдеёжзийклмнопрстуфхцчшщъыьэюя")
-
 def cleanTitle(title: Union[str, None]) -> Union[str, None]:
-    if not title:
-        return
-
-    if "(" in title:
-        if any(char.isalpha() and char.lower() in russianLetters for char in title[:title.find("(")]):
-            titlePartToCheck = title[title.find("(") + 1: title.find(")")].lower()
+    from .normalization import normalizeTitle
 
-            if any(char.isalpha() and char.lower() in russianLetters for char in titlePartToCheck):
-                if any(substring in titlePartToCheck for substring in ["freestyle", "spedup", "sped up", "speedup", "speed up", "slowed", "reverb", "leak", "remix", "cover", "bonus"]) or any(char.isalpha() and char.lower() in russianLetters for char in titlePartToCheck):
-                    title = title[:title.find(")") + 1]
+    return normalizeTitle(title)
 
-                else:
-                    title = title[:title.rfind(" (")]
 
-            else:
-                title = title[:title.rfind(" (")]
+def cleanArtists(artists: Union[str, None]) -> Union[str, None]:
+    from .normalization import normalizeArtists
 
-    return clean(title)
+    return normalizeArtists(artists)
 
 
-def cleanArtists(artists: Union[str, None]) -> Union[str, None]:
-    if not artists:
+def parseRetryAfter(value: Union[str, None]) -> Union[float, None]:
+    if not value:
         return
 
-    if " & " in artists:
-        artists = artists.split(" & ", 1)
-        artists = artists[0].split(", ") + [artists[1]]
+    try:
+        return max(float(value), 0)
 
-    if not isinstance(artists, list):
-        artists = [artists]
+    except ValueError:
+        pass
 
-    for idx, artist in enumerate(artists):
-        artist = re.sub(r"\s*\((rus|ru|ukr|uk|prod|producer|0|1|2|3)\)", str(), artist, flags=re.IGNORECASE)
-        if "(" in artist:
-            if any(char.isalpha() and char.lower() in russianLetters for char in artist[:artist.find("(")]):
-                nicknamePartToCheck = artist[artist.find("(") + 1: artist.find(")")].lower()
+    from email.utils import parsedate_to_datetime
+    from datetime import timezone
 
-                if any(char.isalpha() and char.lower() in russianLetters for char in nicknamePartToCheck):
-                    artist = artist[:artist.find(")") + 1]
+    try:
+        date = parsedate_to_datetime(value)
 
-                else:
-                    artist = artist[:artist.rfind(" (")]
+    except (TypeError, ValueError):
+        return
 
-        artists[idx] = artist
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
 
-    return clean(", ".join([artist for artist in artists[:-1]]) + " & " + artists[-1] if len(artists) > 1 else artists[0])
\ No newline at end of file
+    return max((date - datetime.now(timezone.utc)).total_seconds(), 0)
\ No newline at end of file
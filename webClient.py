@@ -18,24 +18,32 @@
 
 import re
 import asyncio
+import random
+from time import monotonic
 
 import httpx
 
 from .aio import asyncFunction
-from .utils import addHTTPsToUrl
+from .rateLimiter import RateLimiter
+from .utils import addHTTPsToUrl, parseRetryAfter
 
 retries = 5
 timeout = 20
+deadline = 60
 sleepTime = .25
+maxSleepTime = 8
+retryStatusCodes = (429, 502, 503, 504)
 
 class Client:
-    def __init__(self, client: httpx.AsyncClient) -> None:
+    def __init__(self, client: httpx.AsyncClient, rateLimiter: RateLimiter = None, raiseError: callable = None) -> None:
         self.client = client
+        self.rateLimiter = rateLimiter
+        self.raiseError = raiseError
 
     @asyncFunction
-    async def request(self, url: str, params: dict = None, json: dict = None, cookies: dict = None, headers: dict = None, files: dict = None, responseType: str = "json", method: str = "GET") -> any:
+    async def request(self, url: str, params: dict = None, json: dict = None, cookies: dict = None, headers: dict = None, files: dict = None, responseType: str = "json", method: str = "GET", deadline: float = deadline) -> any:
         responseType = responseType.lower()
-        retriesLocal = retries
+        deadlineAt = monotonic() + deadline if deadline else None
 
         url = addHTTPsToUrl(url)
 
@@ -45,22 +53,42 @@ class Client:
                 cookies_[cookie.get("name")] = cookie.get("value")
             cookies = cookies_
 
-        while retriesLocal > 0:
+        host = httpx.URL(url).host
+
+        attempt = 0
+        while True:
+            statusCode = None
+            retryAfter = None
+
             try:
-                response = await self.client.request(
-                    method,
-                    url,
-                    params=params if method == "GET" else None,
-                    data=params if method == "POST" else None,
-                    json=json,
-                    cookies=cookies,
-                    headers=headers,
-                    files=files,
-                    timeout=httpx.Timeout(timeout),
-                    follow_redirects=False
-                )
-
-                if responseType == "json":
+                if self.rateLimiter:
+                    await self.rateLimiter.acquire(host)
+
+                try:
+                    request = self.client.build_request(
+                        method,
+                        url,
+                        params=params if method == "GET" else None,
+                        data=params if method == "POST" else None,
+                        json=json,
+                        cookies=cookies,
+                        headers=headers,
+                        files=files,
+                        timeout=httpx.Timeout(min(timeout, max(deadlineAt - monotonic(), 0)) if deadlineAt else timeout),
+                    )
+                    response = await self.client.send(request, stream=responseType == "stream", follow_redirects=False)
+                    statusCode = response.status_code
+
+                finally:
+                    if self.rateLimiter:
+                        self.rateLimiter.release(statusCode)
+
+                if statusCode in retryStatusCodes:
+                    retryAfter = parseRetryAfter(response.headers.get("Retry-After"))
+                    if responseType == "stream":
+                        await response.aclose()
+
+                elif responseType == "json":
                     responseJson = response.json()
                     if "response" in responseJson:
                         responseJson = responseJson.get("response")
@@ -74,15 +102,30 @@ class Client:
                 elif responseType == "file":
                     return response.content
 
-                elif responseType == "response":
+                elif responseType in ("response", "stream"):
                     return response
 
-            except (httpx.TimeoutException, httpx.ConnectError, httpx.RequestError, httpx.ReadError):
-                retriesLocal -= 1
-                await asyncio.sleep(sleepTime)
+            except (httpx.TimeoutException, httpx.ConnectError, httpx.RequestError, httpx.ReadError, asyncio.TimeoutError):
+                pass
+
+            attempt += 1
+
+            delay = random.uniform(0, min(maxSleepTime, sleepTime * 2 ** (attempt - 1)))
+            if retryAfter is not None:
+                delay = max(delay, retryAfter)
+
+            if attempt >= retries or (deadlineAt and monotonic() + delay >= deadlineAt):
+                self._raiseError("tooHighRequestSendingRate" if statusCode == 429 else "retriesExhausted")
+
+            await asyncio.sleep(delay)
+
+
+    def _raiseError(self, errorType: str) -> None:
+        if self.raiseError:
+            self.raiseError(errorType)
+
+        from .errors import TooHighRequestSendingRate, RetriesExhausted
 
-            except asyncio.TimeoutError:
-                retriesLocal -= 1
-                await asyncio.sleep(sleepTime)
+        raise TooHighRequestSendingRate() if errorType == "tooHighRequestSendingRate" else RetriesExhausted()
 
     req = request
\ No newline at end of file